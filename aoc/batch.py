@@ -0,0 +1,146 @@
+"""
+Solve a day for many input files in parallel.
+
+Usage::
+
+    python -m aoc.batch DAY INPUT [INPUT ...] [--output results.jsonl]
+                        [--workers N] [--chunk-size N]
+
+Each INPUT is a file, a directory of input files or a glob pattern. The
+inputs are submitted to a process pool in chunks to amortize the cost of
+each submission. By default there are CHUNKS_PER_WORKER chunks per worker
+so that the workers stay busy even when some inputs are slower than others.
+The result of each input is written as a JSON line as soon as its chunk
+finishes, so the lines are not in input order. The throughput is reported
+at the end.
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO
+
+from aoc.days import discover_days, load_day_module, solve_text
+from aoc.timing import PhaseTimer
+
+CHUNKS_PER_WORKER = 4
+
+
+def expand_inputs(patterns: Sequence[str]) -> List[Path]:
+    """
+    Expand files, directories and glob patterns into sorted input files.
+    """
+    paths = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.update(child for child in path.iterdir() if child.is_file())
+        elif path.is_file():
+            paths.add(path)
+        else:
+            paths.update(Path(match) for match in glob.glob(pattern, recursive=True))
+    return sorted(path for path in paths if path.is_file())
+
+
+def chunked(paths: Sequence[Path], chunk_size: int) -> Iterator[Sequence[Path]]:
+    for start in range(0, len(paths), chunk_size):
+        yield paths[start : start + chunk_size]
+
+
+def solve_files(day_path: Path, paths: Sequence[Path]) -> List[Dict[str, Any]]:
+    """
+    Solve both parts for each input file of a chunk.
+
+    A failing input is reported as an error without failing the chunk.
+    """
+    module = load_day_module(day_path=day_path)
+    results = []
+    for path in paths:
+        timer = PhaseTimer()
+        try:
+            with timer.phase("read"):
+                text = path.read_text()
+            result: Dict[str, Any] = solve_text(module, text, timer=timer)
+        except Exception as exc:
+            result = {"error": f"{type(exc).__name__}: {exc}"}
+        result["input"] = str(path)
+        result["elapsed"] = sum(phase.elapsed for phase in timer.phases)
+        results.append(result)
+    return results
+
+
+def run_batch(
+    day: int,
+    paths: Sequence[Path],
+    output: TextIO,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """
+    Solve day for all paths and write the results to output as JSON lines.
+
+    Returns the number of inputs that failed.
+    """
+    day_path = discover_days()[day]
+    if chunk_size is None:
+        worker_count = (os.cpu_count() or 1) if max_workers is None else max_workers
+        chunk_size = max(math.ceil(len(paths) / (worker_count * CHUNKS_PER_WORKER)), 1)
+    error_count = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(solve_files, day_path, chunk)
+            for chunk in chunked(paths, chunk_size)
+        ]
+        for future in as_completed(futures):
+            for result in future.result():
+                error_count += "error" in result
+                output.write(f"{json.dumps(result)}\n")
+            output.flush()
+    return error_count
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("day", type=int)
+    parser.add_argument("inputs", nargs="+")
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(argv)
+    paths = expand_inputs(args.inputs)
+    if len(paths) == 0:
+        raise ValueError(f"Expected inputs {args.inputs} to match files.")
+
+    start = time.perf_counter()
+    output = sys.stdout if args.output is None else args.output.open("w")
+    try:
+        error_count = run_batch(
+            day=args.day,
+            paths=paths,
+            output=output,
+            max_workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    total_elapsed = time.perf_counter() - start
+
+    print(
+        f"Solved {len(paths)} inputs ({error_count} failed) in {total_elapsed:.3f} s"
+        f" ({len(paths) / total_elapsed:.1f} inputs/s).",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
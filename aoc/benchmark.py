@@ -0,0 +1,213 @@
+"""
+Benchmark the solvers of each day over generated inputs of growing size.
+
+Usage::
+
+    python -m aoc.benchmark [--days 7 8] [--sizes 10 20 40] [--repeats 5]
+                            [--json report.json] [--csv report.csv]
+
+For each day, part and size the median and 95th percentile wall times and
+the peak memory allocated by the solver are measured. An empirical
+complexity exponent k is fitted for each day and part from
+``time ~ input_length ** k`` over the measured sizes.
+"""
+import argparse
+import csv
+import json
+import math
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from aoc.days import PARTS, discover_days, load_day_module
+from aoc.generate import generate_text
+
+# The meaning of size differs between days, see the generate.py of each day
+DEFAULT_SIZES: Dict[int, Tuple[int, ...]] = {
+    1: (1000, 4000, 16000, 64000),
+    2: (1000, 4000, 16000, 64000),
+    3: (1000, 4000, 16000, 64000),
+    4: (1000, 4000, 16000, 64000),
+    5: (1000, 4000, 16000, 64000),
+    6: (1000, 4000, 16000, 64000),
+    7: (100, 400, 1600, 6400),
+    8: (10, 20, 40, 80),
+    9: (100, 200, 400, 800),
+    10: (1000, 4000, 16000, 64000),
+    11: (2, 4, 8, 16),
+}
+DEFAULT_REPEATS = 5
+
+
+class Measurement(NamedTuple):
+    day: int
+    part: str
+    size: int
+    input_length: int
+    median: float
+    p95: float
+    peak_memory: int
+
+
+class Fit(NamedTuple):
+    day: int
+    part: str
+    exponent: float
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of values.
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def measure(day: int, part: str, size: int, repeats: int) -> Measurement:
+    """
+    Time a single part of a day on a generated input of size.
+
+    Peak memory is measured on a separate run as tracing slows the solver.
+    """
+    solver = getattr(load_day_module(day_path=discover_days()[day]), part)
+    text = generate_text(day=day, size=size)
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        solver(text)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        solver(text)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(
+        day=day,
+        part=part,
+        size=size,
+        input_length=len(text),
+        median=statistics.median(timings),
+        p95=percentile(timings, 0.95),
+        peak_memory=peak_memory,
+    )
+
+
+def fit_exponent(input_lengths: Sequence[int], timings: Sequence[float]) -> float:
+    """
+    Fit k in ``timing ~ input_length ** k`` with least squares in log-log space.
+    """
+    if len(input_lengths) < 2:
+        raise ValueError("Expected at least two measurements to fit an exponent.")
+    slope, _ = statistics.linear_regression(
+        [math.log(length) for length in input_lengths],
+        # Guard against timer resolution producing zero timings
+        [math.log(max(timing, 1e-9)) for timing in timings],
+    )
+    return slope
+
+
+def fit_measurements(measurements: Sequence[Measurement]) -> List[Fit]:
+    fits = []
+    keys = sorted({(measurement.day, measurement.part) for measurement in measurements})
+    for day, part in keys:
+        matching = [
+            measurement
+            for measurement in measurements
+            if (measurement.day, measurement.part) == (day, part)
+        ]
+        if len({measurement.input_length for measurement in matching}) < 2:
+            continue
+        exponent = fit_exponent(
+            input_lengths=[measurement.input_length for measurement in matching],
+            timings=[measurement.median for measurement in matching],
+        )
+        fits.append(Fit(day=day, part=part, exponent=exponent))
+    return fits
+
+
+def run_benchmarks(
+    days: Optional[Sequence[int]] = None,
+    sizes: Optional[Sequence[int]] = None,
+    repeats: int = DEFAULT_REPEATS,
+) -> Tuple[List[Measurement], List[Fit]]:
+    """
+    Measure the requested days with their default sizes unless sizes is given.
+    """
+    days = list(discover_days()) if days is None else days
+    measurements = []
+    for day in days:
+        for part in PARTS:
+            for size in DEFAULT_SIZES[day] if sizes is None else sizes:
+                measurement = measure(day=day, part=part, size=size, repeats=repeats)
+                print(format_measurement(measurement), file=sys.stderr, flush=True)
+                measurements.append(measurement)
+    return measurements, fit_measurements(measurements)
+
+
+def format_measurement(measurement: Measurement) -> str:
+    return (
+        f"Day {measurement.day} {measurement.part} size {measurement.size}: "
+        f"median {measurement.median:.4f} s, p95 {measurement.p95:.4f} s, "
+        f"peak {measurement.peak_memory / 1024:.0f} KiB"
+    )
+
+
+def write_json(
+    file_path: Path, measurements: Sequence[Measurement], fits: Sequence[Fit]
+):
+    report = {
+        "measurements": [measurement._asdict() for measurement in measurements],
+        "fits": [fit._asdict() for fit in fits],
+    }
+    file_path.write_text(json.dumps(report, indent=2))
+
+
+def write_csv(
+    file_path: Path, measurements: Sequence[Measurement], fits: Sequence[Fit]
+):
+    """
+    Write one row per measurement with the fitted exponent of its day and part.
+    """
+    exponents = {(fit.day, fit.part): fit.exponent for fit in fits}
+    with file_path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow([*Measurement._fields, "exponent"])
+        for measurement in measurements:
+            writer.writerow(
+                [*measurement, exponents.get((measurement.day, measurement.part), "")]
+            )
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", nargs="+", type=int, default=None)
+    parser.add_argument("--sizes", nargs="+", type=int, default=None)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--json", type=Path, default=None)
+    parser.add_argument("--csv", type=Path, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(argv)
+    measurements, fits = run_benchmarks(
+        days=args.days, sizes=args.sizes, repeats=args.repeats
+    )
+    if args.json is not None:
+        write_json(file_path=args.json, measurements=measurements, fits=fits)
+    if args.csv is not None:
+        write_csv(file_path=args.csv, measurements=measurements, fits=fits)
+    for fit in fits:
+        print(f"Day {fit.day} {fit.part}: time ~ n ** {fit.exponent:.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,167 @@
+"""
+On-disk cache of answers keyed by the day, part, input and solver version.
+
+Answers are stored in a SQLite database so that the worker processes of the
+runner can share the cache. Once more than ``max_entries`` answers are
+stored the least recently used ones are evicted.
+"""
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, NamedTuple, Optional
+
+DEFAULT_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "advent-of-code-2022"
+    / "results.sqlite3"
+)
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class CacheKey(NamedTuple):
+    day: int
+    part: str
+    input_digest: str
+    solver_version: str
+
+
+def input_digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def solver_version(module: ModuleType) -> str:
+    """
+    Version a solver module by the hash of its source.
+
+    Any edit to the solver thus invalidates its cached answers.
+    """
+    return hashlib.sha256(Path(module.__file__).read_bytes()).hexdigest()
+
+
+class ResultCache:
+    """
+    LRU cache of answers in a SQLite database at path.
+
+    A connection is opened per operation so that instances can be pickled
+    to worker processes.
+    """
+
+    def __init__(
+        self, path: Path = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        if max_entries < 1:
+            raise ValueError(f"Expected max_entries {max_entries} to be positive.")
+        self.path = path
+        self.max_entries = max_entries
+
+    def __repr__(self) -> str:
+        return f"ResultCache(path={self.path}, max_entries={self.max_entries})"
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                day INTEGER,
+                part TEXT,
+                input_digest TEXT,
+                solver_version TEXT,
+                answer TEXT,
+                last_used INTEGER,
+                PRIMARY KEY (day, part, input_digest, solver_version)
+            )
+            """
+        )
+        return connection
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Get the answer stored for key or None if there is none.
+        """
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                """
+                SELECT answer FROM results WHERE
+                day = ? AND part = ? AND input_digest = ? AND solver_version = ?
+                """,
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                """
+                UPDATE results SET last_used = ? WHERE
+                day = ? AND part = ? AND input_digest = ? AND solver_version = ?
+                """,
+                (time.time_ns(), *key),
+            )
+        return json.loads(row[0])
+
+    def put(self, key: CacheKey, answer: Any):
+        """
+        Store the answer for key and evict the least recently used answers.
+        """
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, json.dumps(answer), time.time_ns()),
+            )
+            connection.execute(
+                """
+                DELETE FROM results WHERE rowid NOT IN (
+                    SELECT rowid FROM results ORDER BY last_used DESC LIMIT ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    def invalidate(self, day: Optional[int] = None, part: Optional[str] = None):
+        """
+        Remove the stored answers of day and part, or all of them if None.
+        """
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                """
+                DELETE FROM results WHERE
+                (? IS NULL OR day = ?) AND (? IS NULL OR part = ?)
+                """,
+                (day, day, part, part),
+            )
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+def cached_solver(
+    solver: Callable[[str], Any],
+    day: int,
+    cache: ResultCache,
+    version: Optional[str] = None,
+) -> Callable[[str], Any]:
+    """
+    Wrap a first_part or second_part function to look up answers from cache.
+
+    The version defaults to the hash of the module that defines the solver.
+    """
+    if version is None:
+        version = solver_version(sys.modules[solver.__module__])
+
+    @functools.wraps(solver)
+    def wrapper(text: str) -> Any:
+        key = CacheKey(day, solver.__name__, input_digest(text), version)
+        answer = cache.get(key)
+        if answer is None:
+            answer = solver(text)
+            cache.put(key, answer)
+        return answer
+
+    return wrapper
@@ -0,0 +1,77 @@
+"""
+Thin client that asks the solver daemon of aoc.daemon for answers.
+
+Usage::
+
+    python -m aoc.client DAY INPUT [--part first_part] [--socket PATH]
+
+Only the standard library modules needed to talk to the daemon are imported
+so that the startup cost stays small.
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+DEFAULT_SOCKET_PATH = (
+    Path(os.environ.get("XDG_RUNTIME_DIR", "/tmp")) / "advent-of-code-2022.sock"
+)
+
+
+def request_solve(
+    request: Dict[str, Any], socket_path: Path = DEFAULT_SOCKET_PATH
+) -> Dict[str, Any]:
+    """
+    Send a single request to the daemon and return its response.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        with connection.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode() + b"\n")
+            stream.flush()
+            # Signal the end of requests so that the daemon closes its side
+            connection.shutdown(socket.SHUT_WR)
+            line = stream.readline()
+    if not line:
+        raise ConnectionError(f"Expected a response from daemon at {socket_path}.")
+    response = json.loads(line)
+    if "error" in response:
+        raise RuntimeError(response["error"])
+    return response
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("day", type=int)
+    parser.add_argument("input", type=Path)
+    parser.add_argument("--part", choices=("first_part", "second_part"), default=None)
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    parser.add_argument(
+        "--send-text",
+        action="store_true",
+        help="Send the input contents instead of its path.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(argv)
+    request: Dict[str, Any] = {"day": args.day, "part": args.part}
+    if args.send_text:
+        request["text"] = args.input.read_text()
+    else:
+        request["path"] = str(args.input.resolve())
+
+    response = request_solve(request, socket_path=args.socket)
+
+    for part, answer in response["answers"].items():
+        part_name = part.replace("_part", "")
+        separator = "\n\n" if "\n" in str(answer) else " "
+        print(f"Answer to {part_name} part:{separator}{answer}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
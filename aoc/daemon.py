@@ -0,0 +1,143 @@
+"""
+Long-running daemon that keeps every day module loaded and solves requests
+sent over a Unix domain socket.
+
+Usage::
+
+    python -m aoc.daemon [--socket PATH] [--threads]
+
+Each line sent to the socket is a JSON request such as::
+
+    {"day": 11, "part": "second_part", "path": "/inputs/day-11.txt"}
+
+The input is given either as a ``path`` readable by the daemon or as the
+``text`` itself. Without a ``part`` both parts are solved, from a shared
+model for days that have ``parse_model``. Each request is answered with a
+JSON line of the answers and the timings of its phases, or of an error.
+
+Requests are served in forked children of the daemon, which share the
+loaded modules, so that they are solved in parallel. With ``--threads``
+they are served in threads instead.
+"""
+import argparse
+import json
+import socket
+import socketserver
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Optional, Sequence
+
+from aoc.client import DEFAULT_SOCKET_PATH
+from aoc.days import PARTS, discover_days, load_day_module, solve_text
+from aoc.timing import PhaseTimer
+
+
+def preload_modules() -> Dict[int, ModuleType]:
+    return {
+        day: load_day_module(day_path=day_path)
+        for day, day_path in discover_days().items()
+    }
+
+
+def solve(modules: Dict[int, ModuleType], request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Solve a single request with the preloaded modules.
+    """
+    day, part = request["day"], request.get("part")
+    if day not in modules:
+        raise ValueError(f"Expected day {day} to be one of {list(modules)}.")
+    if part is not None and part not in PARTS:
+        raise ValueError(f"Expected part {part} to be one of {PARTS}.")
+    module = modules[day]
+
+    timer = PhaseTimer()
+    if "text" in request:
+        text = request["text"]
+    else:
+        with timer.phase("read"):
+            text = Path(request["path"]).read_text()
+
+    answers = solve_text(
+        module, text, parts=PARTS if part is None else (part,), timer=timer
+    )
+
+    return {
+        "day": day,
+        "answers": answers,
+        "elapsed": {phase.name: phase.elapsed for phase in timer.phases},
+    }
+
+
+class SolverRequestHandler(socketserver.StreamRequestHandler):
+    server: "SolverServer"
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = solve(self.server.modules, json.loads(line))
+            except Exception as exc:
+                response = {"error": f"{type(exc).__name__}: {exc}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path, modules: Dict[int, ModuleType]):
+        self.modules = modules
+        super().__init__(str(socket_path), SolverRequestHandler)
+
+
+class ForkingSolverServer(socketserver.ForkingMixIn, SolverServer):
+    pass
+
+
+class ThreadingSolverServer(socketserver.ThreadingMixIn, SolverServer):
+    daemon_threads = True
+
+
+def remove_stale_socket(socket_path: Path):
+    """
+    Remove a socket left behind by a daemon that is no longer running.
+    """
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink()
+            return
+    raise FileExistsError(f"Expected no daemon to be listening on {socket_path}.")
+
+
+def create_server(
+    socket_path: Path = DEFAULT_SOCKET_PATH, threads: bool = False
+) -> SolverServer:
+    remove_stale_socket(socket_path)
+    server_class = ThreadingSolverServer if threads else ForkingSolverServer
+    return server_class(socket_path=socket_path, modules=preload_modules())
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET_PATH)
+    parser.add_argument("--threads", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(argv)
+    server = create_server(socket_path=args.socket, threads=args.threads)
+    print(f"Serving {len(server.modules)} days on {args.socket}", flush=True)
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        args.socket.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,87 @@
+"""
+Discovery and loading of the day-N solver modules.
+"""
+import importlib.util
+import re
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Optional, Sequence
+
+from aoc.timing import PhaseTimer
+
+REPOSITORY_PATH = Path(__file__).parent.parent
+DAY_DIRECTORY_PATTERN = re.compile(r"day-(\d+)")
+PARTS = ("first_part", "second_part")
+MODEL_PARSER = "parse_model"
+MODEL_PARTS = {
+    "first_part": "first_part_from_model",
+    "second_part": "second_part_from_model",
+}
+PUZZLE_INPUT_NAME = "puzzle_input.txt"
+
+
+def discover_days(repository_path: Path = REPOSITORY_PATH) -> Dict[int, Path]:
+    """
+    Find all day-N directories that contain a main.py, ordered by day.
+    """
+    days = {}
+    for path in repository_path.iterdir():
+        match = DAY_DIRECTORY_PATTERN.fullmatch(path.name)
+        if match is None or not (path / "main.py").is_file():
+            continue
+        days[int(match.group(1))] = path
+    return dict(sorted(days.items()))
+
+
+def load_day_module(day_path: Path, module_stem: str = "main") -> ModuleType:
+    """
+    Import a module from a day directory under a name unique to the day.
+
+    Every day has a main.py so they cannot all be imported as ``main``.
+    """
+    module_name = f"{day_path.name.replace('-', '_')}_{module_stem}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(
+        module_name, day_path / f"{module_stem}.py"
+    )
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Expected to find {module_stem}.py in {day_path}.")
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolve their module through sys.modules
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def solve_text(
+    module: ModuleType,
+    text: str,
+    parts: Sequence[str] = PARTS,
+    timer: Optional[PhaseTimer] = None,
+) -> Dict[str, Any]:
+    """
+    Solve parts of a day, timing each phase with timer if given.
+
+    When all parts are solved and the day has parse_model they are solved
+    from a single parsed model.
+    """
+    timer = PhaseTimer() if timer is None else timer
+    answers = {}
+    if tuple(parts) == PARTS and hasattr(module, MODEL_PARSER):
+        with timer.phase(MODEL_PARSER):
+            model = getattr(module, MODEL_PARSER)(text)
+        for part in parts:
+            with timer.phase(part):
+                answers[part] = getattr(module, MODEL_PARTS[part])(model)
+    else:
+        for part in parts:
+            with timer.phase(part):
+                answers[part] = getattr(module, part)(text)
+    return answers
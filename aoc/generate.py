@@ -0,0 +1,60 @@
+"""
+Write synthetic puzzle inputs of any size with the generate.py of each day.
+
+Usage::
+
+    python -m aoc.generate DAY SIZE OUTPUT [--seed SEED]
+
+The meaning of SIZE depends on the day, e.g. the number of elves for day 1
+and the side length of the tree grid for day 8.
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from aoc.days import discover_days, load_day_module
+
+
+def write_input(
+    day: int, file_path: Path, size: int, seed: Optional[int] = None
+) -> Path:
+    """
+    Write a generated input for day to file_path.
+
+    The chunks are written as they are generated so that inputs larger than
+    memory can be written.
+    """
+    generator = load_day_module(day_path=discover_days()[day], module_stem="generate")
+    seed = generator.SEED if seed is None else seed
+    with file_path.open("w") as handle:
+        for chunk in generator.generate_input(size, seed=seed):
+            handle.write(chunk)
+    return file_path
+
+
+def generate_text(day: int, size: int, seed: Optional[int] = None) -> str:
+    """
+    Generate an input for day in memory.
+    """
+    generator = load_day_module(day_path=discover_days()[day], module_stem="generate")
+    seed = generator.SEED if seed is None else seed
+    return "".join(generator.generate_input(size, seed=seed))
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=int)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(argv)
+    write_input(day=args.day, file_path=args.output, size=args.size, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
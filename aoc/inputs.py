@@ -0,0 +1,78 @@
+"""
+Streaming and memory-mapped access to puzzle inputs.
+
+``file_path.read_text()`` followed by ``splitlines()`` holds the input
+twice in memory. The iterators here hold a single line, record or chunk at a
+time instead, which lets the streaming entry points of the days, such as
+``solve_lines`` of day 1, run over inputs larger than memory.
+"""
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List, Union
+
+DEFAULT_CHUNK_SIZE = 2**20
+
+
+def iter_lines(file_path: Path) -> Iterator[str]:
+    """
+    Yield the lines of a file without line endings, like ``str.splitlines``.
+    """
+    with file_path.open() as handle:
+        for line in handle:
+            yield line.rstrip("\n")
+
+
+def iter_records(lines: Iterable[str]) -> Iterator[List[str]]:
+    """
+    Group lines into records separated by blank lines.
+    """
+    record: List[str] = []
+    for line in lines:
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+def iter_chunks(file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Yield the text of a file in chunks of at most chunk_size characters.
+    """
+    with file_path.open() as handle:
+        while chunk := handle.read(chunk_size):
+            yield chunk
+
+
+@contextmanager
+def mapped_bytes(file_path: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Map a file read-only into memory.
+
+    The mapping supports slicing, ``find`` and ``readline`` like bytes while
+    the operating system pages the file in and out as needed. Empty files
+    cannot be mapped and are given as empty bytes.
+    """
+    with file_path.open("rb") as handle:
+        if file_path.stat().st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def iter_mapped_lines(mapped: Union[mmap.mmap, bytes]) -> Iterator[bytes]:
+    """
+    Yield the lines of a mapping as bytes without line endings.
+    """
+    start = 0
+    end = len(mapped)
+    while start < end:
+        newline = mapped.find(b"\n", start)
+        if newline == -1:
+            newline = end
+        yield mapped[start:newline]
+        start = newline + 1
@@ -0,0 +1,84 @@
+"""
+Memory footprint of named phases with tracemalloc.
+
+For each phase the peak allocated memory and the memory still retained at
+the end of the phase are measured relative to the start of the phase. The
+source lines that retain the most memory are reported as the top allocation
+sites, e.g. the nested lists of the matrix built by the day-8 parse_model.
+"""
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+DEFAULT_TOP_COUNT = 5
+
+# Allocations made by the tracing itself and the import machinery are not
+# reported
+TRACE_FILTERS = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+
+class AllocationSite(NamedTuple):
+    location: str
+    size: int
+    count: int
+
+
+class PhaseMemory(NamedTuple):
+    peak: int
+    retained: int
+    top_sites: List[AllocationSite]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "peak": self.peak,
+            "retained": self.retained,
+            "top_sites": [site._asdict() for site in self.top_sites],
+        }
+
+
+class MemoryTracer:
+    """
+    Trace the allocations of phases, which must not be nested.
+    """
+
+    def __init__(self, top_count: int = DEFAULT_TOP_COUNT):
+        self.top_count = top_count
+        self.phases: Dict[str, PhaseMemory] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        before = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+        tracemalloc.reset_peak()
+        current_before, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            current_after, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+            if started_tracing:
+                tracemalloc.stop()
+
+            differences = after.compare_to(before, "lineno")
+            top_sites = [
+                AllocationSite(
+                    location=f"{difference.traceback[0].filename}:"
+                    f"{difference.traceback[0].lineno}",
+                    size=difference.size_diff,
+                    count=difference.count_diff,
+                )
+                for difference in differences[: self.top_count]
+                if difference.size_diff > 0
+            ]
+            self.phases[name] = PhaseMemory(
+                peak=peak - current_before,
+                retained=current_after - current_before,
+                top_sites=top_sites,
+            )
@@ -0,0 +1,299 @@
+"""
+Run the solvers of all days concurrently on a process pool.
+
+Usage::
+
+    python -m aoc.runner [--days 1 2 ...] [--input-name puzzle_input.txt]
+                         [--parse-once] [--no-cache] [--invalidate-cache]
+                         [--timings timings.json] [--profile-dir profiles]
+                         [--memory]
+
+With ``--parse-once`` each day is a single task that parses the input once
+with the ``parse_model`` function of the day and solves both parts from the
+parsed model. Days without ``parse_model`` solve both parts from the text.
+
+Answers are looked up from and stored to the on-disk cache of aoc.cache
+unless ``--no-cache`` is given. ``--invalidate-cache`` first removes the
+stored answers of the requested days.
+
+Reading the input, parsing and solving each part are timed as phases with
+aoc.timing. ``--timings`` writes the phases as JSON and ``--profile-dir``
+dumps a cProfile of each phase under a directory per task. ``--memory``
+traces the peak and retained allocations of each phase with aoc.memory and
+reports the top allocation sites.
+"""
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from aoc.cache import (
+    DEFAULT_CACHE_PATH,
+    DEFAULT_MAX_ENTRIES,
+    CacheKey,
+    ResultCache,
+    input_digest,
+    solver_version,
+)
+from aoc.days import (
+    MODEL_PARSER,
+    MODEL_PARTS,
+    PARTS,
+    PUZZLE_INPUT_NAME,
+    discover_days,
+    load_day_module,
+)
+from aoc.memory import MemoryTracer, PhaseMemory
+from aoc.timing import PhaseTimer
+
+READ_PHASE = "read"
+
+
+class Task(NamedTuple):
+    day: int
+    day_path: Path
+    # None solves all parts of the day in the same task
+    part: Optional[str]
+    input_path: Path
+    cache: Optional[ResultCache] = None
+    profile_dir: Optional[Path] = None
+    trace_memory: bool = False
+
+
+class TaskResult(NamedTuple):
+    day: int
+    part: str
+    answer: str
+    elapsed: float
+    cached: bool = False
+    profile_path: Optional[Path] = None
+    memory: Optional[PhaseMemory] = None
+
+
+def timed_call(
+    timer: PhaseTimer, name: str, function: Callable[[Any], Any], argument: Any
+) -> Any:
+    with timer.phase(name):
+        return function(argument)
+
+
+def task_profile_dir(task: Task) -> Optional[Path]:
+    if task.profile_dir is None:
+        return None
+    task_name = f"day-{task.day}" + ("" if task.part is None else f"-{task.part}")
+    return task.profile_dir / task_name
+
+
+def run_task(task: Task) -> List[TaskResult]:
+    """
+    Solve a single part of a single day or all parts of a day.
+
+    The module is loaded inside the worker as the day modules cannot be
+    pickled by name.
+    """
+    module = load_day_module(day_path=task.day_path)
+    timer = PhaseTimer(
+        profile_dir=task_profile_dir(task),
+        memory_tracer=MemoryTracer() if task.trace_memory else None,
+    )
+    text = timed_call(timer, READ_PHASE, Path.read_text, task.input_path)
+    results = {READ_PHASE: phase_result(task.day, timer)}
+    parts = PARTS if task.part is None else (task.part,)
+
+    if task.cache is not None:
+        version = solver_version(module)
+        digest = input_digest(text)
+        keys = {part: CacheKey(task.day, part, digest, version) for part in parts}
+        for part in parts:
+            answer = timed_call(timer, part, task.cache.get, keys[part])
+            if answer is not None:
+                results[part] = phase_result(task.day, timer, answer, cached=True)
+
+    missing = [part for part in parts if part not in results]
+    answers = {}
+    if task.part is None and missing and hasattr(module, MODEL_PARSER):
+        model = timed_call(timer, MODEL_PARSER, getattr(module, MODEL_PARSER), text)
+        results[MODEL_PARSER] = phase_result(task.day, timer)
+        for part in missing:
+            answers[part] = timed_call(
+                timer, part, getattr(module, MODEL_PARTS[part]), model
+            )
+            results[part] = phase_result(task.day, timer, answers[part])
+    else:
+        for part in missing:
+            answers[part] = timed_call(timer, part, getattr(module, part), text)
+            results[part] = phase_result(task.day, timer, answers[part])
+
+    if task.cache is not None:
+        for part, answer in answers.items():
+            task.cache.put(keys[part], answer)
+
+    return sorted(results.values(), key=result_order)
+
+
+def phase_result(
+    day: int, timer: PhaseTimer, answer: Any = "", cached: bool = False
+) -> TaskResult:
+    """
+    Create a result from the last phase of timer.
+    """
+    phase = timer.last
+    return TaskResult(
+        day=day,
+        part=phase.name,
+        answer=str(answer),
+        elapsed=phase.elapsed,
+        cached=cached,
+        profile_path=phase.profile_path,
+        memory=phase.memory,
+    )
+
+
+def collect_tasks(
+    days: Optional[Sequence[int]] = None,
+    input_name: str = PUZZLE_INPUT_NAME,
+    parse_once: bool = False,
+    cache: Optional[ResultCache] = None,
+    profile_dir: Optional[Path] = None,
+    trace_memory: bool = False,
+) -> List[Task]:
+    """
+    Create a task for each part of each requested day.
+
+    With parse_once a single task is created for each day instead.
+    """
+    discovered = discover_days()
+    if days is None:
+        days = list(discovered)
+    missing = [day for day in days if day not in discovered]
+    if missing:
+        raise ValueError(f"Expected days {missing} to exist in the repository.")
+
+    return [
+        Task(
+            day=day,
+            day_path=discovered[day],
+            part=part,
+            input_path=discovered[day] / input_name,
+            cache=cache,
+            profile_dir=profile_dir,
+            trace_memory=trace_memory,
+        )
+        for day in days
+        for part in ((None,) if parse_once else PARTS)
+    ]
+
+
+def run_tasks(
+    tasks: Sequence[Task], max_workers: Optional[int] = None
+) -> List[TaskResult]:
+    """
+    Run tasks on a process pool, printing results as they finish.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_task, task) for task in tasks]
+        for future in as_completed(futures):
+            for result in future.result():
+                print(format_result(result), flush=True)
+                results.append(result)
+    return sorted(results, key=result_order)
+
+
+def result_order(result: TaskResult) -> Tuple[int, int]:
+    return result.day, (READ_PHASE, MODEL_PARSER, *PARTS).index(result.part)
+
+
+def format_result(result: TaskResult) -> str:
+    timing = f"{result.elapsed:.3f} s{', cached' if result.cached else ''}"
+    if result.memory is not None:
+        timing += (
+            f", peak {format_size(result.memory.peak)}"
+            f", retained {format_size(result.memory.retained)}"
+        )
+    if result.part in (READ_PHASE, MODEL_PARSER):
+        formatted = f"Day {result.day} {result.part} ({timing})"
+    else:
+        answer = f"\n{result.answer}" if "\n" in result.answer else result.answer
+        formatted = f"Day {result.day} {result.part} ({timing}): {answer}"
+    if result.memory is not None:
+        for site in result.memory.top_sites:
+            formatted += f"\n    {format_size(site.size)} in {site.count} blocks"
+            formatted += f" at {site.location}"
+    return formatted
+
+
+def format_size(size: int) -> str:
+    return f"{size / 2**10:.1f} KiB"
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", nargs="+", type=int, default=None)
+    parser.add_argument("--input-name", default=PUZZLE_INPUT_NAME)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--parse-once", action="store_true")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--invalidate-cache", action="store_true")
+    parser.add_argument("--cache-path", type=Path, default=DEFAULT_CACHE_PATH)
+    parser.add_argument("--cache-max-entries", type=int, default=DEFAULT_MAX_ENTRIES)
+    parser.add_argument("--timings", type=Path, default=None)
+    parser.add_argument("--profile-dir", type=Path, default=None)
+    parser.add_argument("--memory", action="store_true")
+    return parser.parse_args(argv)
+
+
+def write_timings(file_path: Path, results: Sequence[TaskResult]):
+    """
+    Write the phases of all results as JSON.
+    """
+    timings = [
+        {
+            "day": result.day,
+            "phase": result.part,
+            "elapsed": result.elapsed,
+            "cached": result.cached,
+            "profile_path": (
+                None if result.profile_path is None else str(result.profile_path)
+            ),
+            "memory": None if result.memory is None else result.memory.to_dict(),
+        }
+        for result in results
+    ]
+    file_path.write_text(json.dumps(timings, indent=2))
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(argv)
+    cache = (
+        None
+        if args.no_cache
+        else ResultCache(path=args.cache_path, max_entries=args.cache_max_entries)
+    )
+    tasks = collect_tasks(
+        days=args.days,
+        input_name=args.input_name,
+        parse_once=args.parse_once,
+        cache=cache,
+        profile_dir=args.profile_dir,
+        trace_memory=args.memory,
+    )
+    if cache is not None and args.invalidate_cache:
+        for day in sorted({task.day for task in tasks}):
+            cache.invalidate(day=day)
+
+    start = time.perf_counter()
+    results = run_tasks(tasks=tasks, max_workers=args.workers)
+    total_elapsed = time.perf_counter() - start
+
+    if args.timings is not None:
+        write_timings(file_path=args.timings, results=results)
+
+    print(f"Solved {len(tasks)} tasks in {total_elapsed:.3f} s total.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
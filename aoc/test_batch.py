@@ -0,0 +1,51 @@
+import io
+import json
+
+from aoc import batch
+from aoc.generate import write_input
+
+
+def test_expand_inputs(tmp_path):
+    for name in ("a.txt", "b.txt", "c.log"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "nested").mkdir()
+
+    assert batch.expand_inputs([str(tmp_path)]) == [
+        tmp_path / "a.txt",
+        tmp_path / "b.txt",
+        tmp_path / "c.log",
+    ]
+    assert batch.expand_inputs([str(tmp_path / "*.txt"), str(tmp_path / "a.txt")]) == [
+        tmp_path / "a.txt",
+        tmp_path / "b.txt",
+    ]
+
+
+def test_chunked():
+    assert list(batch.chunked(list(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_run_batch(tmp_path):
+    paths = [
+        write_input(day=4, file_path=tmp_path / f"{seed}.txt", size=50, seed=seed)
+        for seed in range(5)
+    ]
+    broken_path = tmp_path / "broken.txt"
+    broken_path.write_text("not an assignment\n")
+    output = io.StringIO()
+
+    error_count = batch.run_batch(
+        day=4, paths=[*paths, broken_path], output=output, max_workers=2, chunk_size=2
+    )
+
+    assert error_count == 1
+    results = {
+        result["input"]: result
+        for result in map(json.loads, output.getvalue().splitlines())
+    }
+    assert len(results) == 6
+    assert "error" in results[str(broken_path)]
+    expected = batch.solve_files(day_path=batch.discover_days()[4], paths=paths)
+    for result in expected:
+        assert results[result["input"]]["first_part"] == result["first_part"]
+        assert results[result["input"]]["second_part"] == result["second_part"]
@@ -0,0 +1,41 @@
+import csv
+import json
+
+import pytest
+
+from aoc import benchmark
+
+
+def test_percentile():
+    values = [float(value) for value in range(1, 101)]
+    assert benchmark.percentile(values, 0.95) == 95.0
+    assert benchmark.percentile(values, 0.5) == 50.0
+    assert benchmark.percentile([3.0], 0.95) == 3.0
+
+
+@pytest.mark.parametrize("exponent", [1.0, 2.0, 3.0])
+def test_fit_exponent(exponent: float):
+    input_lengths = [10, 100, 1000, 10000]
+    timings = [0.001 * length**exponent for length in input_lengths]
+    assert benchmark.fit_exponent(input_lengths, timings) == pytest.approx(exponent)
+
+
+def test_run_benchmarks_writes_reports(tmp_path):
+    measurements, fits = benchmark.run_benchmarks(
+        days=[2], sizes=[100, 400], repeats=2
+    )
+    assert len(measurements) == 4
+    assert {fit.part for fit in fits} == {"first_part", "second_part"}
+    assert all(
+        measurement.p95 >= measurement.median and measurement.peak_memory > 0
+        for measurement in measurements
+    )
+
+    json_path, csv_path = tmp_path / "report.json", tmp_path / "report.csv"
+    benchmark.write_json(json_path, measurements=measurements, fits=fits)
+    benchmark.write_csv(csv_path, measurements=measurements, fits=fits)
+    assert len(json.loads(json_path.read_text())["fits"]) == 2
+    with csv_path.open() as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == 4
+    assert all(row["exponent"] for row in rows)
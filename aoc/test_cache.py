@@ -0,0 +1,72 @@
+from aoc import runner
+from aoc.cache import CacheKey, ResultCache, cached_solver, input_digest
+
+
+def make_key(part: str = "first_part", text: str = "text") -> CacheKey:
+    return CacheKey(
+        day=1, part=part, input_digest=input_digest(text), solver_version="v1"
+    )
+
+
+def test_get_and_put(tmp_path):
+    cache = ResultCache(path=tmp_path / "cache.sqlite3")
+    assert cache.get(make_key()) is None
+    cache.put(make_key(), 123)
+    cache.put(make_key(part="second_part"), "CMZ")
+    assert cache.get(make_key()) == 123
+    assert cache.get(make_key(part="second_part")) == "CMZ"
+    assert cache.get(make_key(text="other")) is None
+
+
+def test_least_recently_used_is_evicted(tmp_path):
+    cache = ResultCache(path=tmp_path / "cache.sqlite3", max_entries=2)
+    cache.put(make_key(text="a"), 1)
+    cache.put(make_key(text="b"), 2)
+    # Using a makes b the least recently used
+    assert cache.get(make_key(text="a")) == 1
+    cache.put(make_key(text="c"), 3)
+    assert len(cache) == 2
+    assert cache.get(make_key(text="b")) is None
+    assert cache.get(make_key(text="a")) == 1
+    assert cache.get(make_key(text="c")) == 3
+
+
+def test_invalidate(tmp_path):
+    cache = ResultCache(path=tmp_path / "cache.sqlite3")
+    cache.put(make_key(), 1)
+    cache.put(make_key(part="second_part"), 2)
+    cache.invalidate(day=1, part="first_part")
+    assert cache.get(make_key()) is None
+    assert cache.get(make_key(part="second_part")) == 2
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_cached_solver(tmp_path):
+    calls = []
+
+    def first_part(text: str) -> int:
+        calls.append(text)
+        return len(text)
+
+    cache = ResultCache(path=tmp_path / "cache.sqlite3")
+    solver = cached_solver(first_part, day=1, cache=cache, version="v1")
+    assert solver.__name__ == "first_part"
+    assert solver("abc") == 3
+    assert solver("abc") == 3
+    assert solver("abcd") == 4
+    assert calls == ["abc", "abcd"]
+
+
+def test_runner_uses_cache(tmp_path):
+    cache = ResultCache(path=tmp_path / "cache.sqlite3")
+    (task,) = runner.collect_tasks(
+        days=[5], input_name="sample_data.txt", parse_once=True, cache=cache
+    )
+    first_results = runner.run_task(task)
+    assert not any(result.cached for result in first_results)
+    read_result, *second_results = runner.run_task(task)
+    assert read_result.part == "read"
+    assert [result.part for result in second_results] == ["first_part", "second_part"]
+    assert all(result.cached for result in second_results)
+    assert [result.answer for result in second_results] == ["CMZ", "MCD"]
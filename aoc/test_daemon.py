@@ -0,0 +1,70 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from aoc import client, daemon
+from aoc.days import discover_days
+
+
+@pytest.fixture(params=[True, False], ids=["threads", "fork"])
+def socket_path(tmp_path, request):
+    socket_path = tmp_path / "daemon.sock"
+    server = daemon.create_server(socket_path=socket_path, threads=request.param)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_solve_both_parts_from_path(socket_path: Path):
+    response = client.request_solve(
+        {"day": 5, "path": str(discover_days()[5] / "sample_data.txt")},
+        socket_path=socket_path,
+    )
+    assert response["answers"] == {"first_part": "CMZ", "second_part": "MCD"}
+    assert set(response["elapsed"]) == {
+        "read",
+        "parse_model",
+        "first_part",
+        "second_part",
+    }
+
+
+def test_solve_single_part_from_text(socket_path: Path):
+    text = (discover_days()[4] / "sample_data.txt").read_text()
+    response = client.request_solve(
+        {"day": 4, "part": "second_part", "text": text}, socket_path=socket_path
+    )
+    assert response["answers"] == {"second_part": 4}
+
+
+def test_error_response(socket_path: Path):
+    with pytest.raises(RuntimeError, match="Expected day 99"):
+        client.request_solve({"day": 99, "text": ""}, socket_path=socket_path)
+
+
+def test_stale_socket_is_removed(tmp_path):
+    socket_path = tmp_path / "daemon.sock"
+    server = daemon.create_server(socket_path=socket_path, threads=True)
+    server.server_close()
+    assert socket_path.exists()
+    daemon.remove_stale_socket(socket_path)
+    assert not socket_path.exists()
+
+
+def test_client_main(socket_path: Path, capsys):
+    client.main(
+        [
+            "3",
+            str(discover_days()[3] / "sample_data.txt"),
+            "--socket",
+            str(socket_path),
+        ]
+    )
+    assert capsys.readouterr().out.splitlines() == [
+        "Answer to first part: 157",
+        "Answer to second part: 70",
+    ]
@@ -0,0 +1,23 @@
+import pytest
+
+from aoc.days import PARTS, discover_days, load_day_module
+from aoc.generate import generate_text, write_input
+
+
+@pytest.mark.parametrize("day", list(discover_days()))
+def test_generated_input_is_solvable(day: int):
+    module = load_day_module(day_path=discover_days()[day])
+    text = generate_text(day=day, size=30)
+    for part in PARTS:
+        assert getattr(module, part)(text) is not None
+
+
+@pytest.mark.parametrize("day", list(discover_days()))
+def test_generated_input_is_deterministic(day: int):
+    assert generate_text(day=day, size=10) == generate_text(day=day, size=10)
+    assert generate_text(day=day, size=10) != generate_text(day=day, size=10, seed=1)
+
+
+def test_write_input(tmp_path):
+    file_path = write_input(day=2, file_path=tmp_path / "input.txt", size=100)
+    assert len(file_path.read_text().splitlines()) == 100
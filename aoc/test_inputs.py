@@ -0,0 +1,58 @@
+import pytest
+
+from aoc import inputs
+from aoc.days import discover_days, load_day_module
+
+
+def test_iter_lines(tmp_path):
+    file_path = tmp_path / "input.txt"
+    file_path.write_text("a\n\nbc\nd")
+    assert list(inputs.iter_lines(file_path)) == "a\n\nbc\nd".splitlines()
+
+
+def test_iter_records():
+    lines = ["1", "2", "", "3", "", "", "4", "5", ""]
+    assert list(inputs.iter_records(lines)) == [["1", "2"], ["3"], ["4", "5"]]
+
+
+def test_iter_chunks(tmp_path):
+    file_path = tmp_path / "input.txt"
+    file_path.write_text("abcdefg\n")
+    assert list(inputs.iter_chunks(file_path, chunk_size=3)) == ["abc", "def", "g\n"]
+
+
+@pytest.mark.parametrize("text", ["", "a\n\nbc\nd", "a\nb\n"])
+def test_mapped_lines(tmp_path, text: str):
+    file_path = tmp_path / "input.txt"
+    file_path.write_text(text)
+    with inputs.mapped_bytes(file_path) as mapped:
+        assert mapped[:] == text.encode()
+        lines = list(inputs.iter_mapped_lines(mapped))
+    assert lines == [line.encode() for line in text.splitlines()]
+
+
+@pytest.mark.parametrize("day", [1, 2, 3, 4, 10])
+@pytest.mark.parametrize("input_name", ["sample_data.txt", "puzzle_input.txt"])
+def test_solve_lines(day: int, input_name: str):
+    file_path = discover_days()[day] / input_name
+    module = load_day_module(day_path=discover_days()[day])
+    text = file_path.read_text()
+    assert module.solve_lines(inputs.iter_lines(file_path)) == (
+        module.first_part(text),
+        module.second_part(text),
+    )
+
+
+def test_solve_chunks():
+    file_path = discover_days()[6] / "puzzle_input.txt"
+    module = load_day_module(day_path=discover_days()[6])
+    text = file_path.read_text()
+    assert module.solve_chunks(inputs.iter_chunks(file_path, chunk_size=7)) == (
+        module.first_part(text),
+        module.second_part(text),
+    )
+    for line in (discover_days()[6] / "sample_data.txt").read_text().splitlines():
+        assert module.solve_chunks([line]) == (
+            module.first_part(line),
+            module.second_part(line),
+        )
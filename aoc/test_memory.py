@@ -0,0 +1,45 @@
+import tracemalloc
+
+from aoc import runner
+from aoc.memory import MemoryTracer
+from aoc.timing import PhaseTimer
+
+
+def test_phase_peak_and_retained():
+    tracer = MemoryTracer()
+    with tracer.phase("retain"):
+        retained = [list(range(100)) for _ in range(100)]
+    with tracer.phase("release"):
+        released = [list(range(100)) for _ in range(100)]
+        del released
+
+    assert not tracemalloc.is_tracing()
+    retain, release = tracer.phases["retain"], tracer.phases["release"]
+    assert retain.retained > 100 * 100 * 8
+    assert retain.peak >= retain.retained
+    assert release.peak > 100 * 100 * 8
+    assert release.retained < release.peak
+    assert __file__ in retain.top_sites[0].location
+    assert len(retained) == 100
+
+
+def test_phase_timer_with_memory_tracer():
+    timer = PhaseTimer(memory_tracer=MemoryTracer(top_count=1))
+    with timer.phase("parse"):
+        parsed = list(range(1000))
+    assert timer.last.memory is not None
+    assert timer.last.memory.retained > 0
+    assert len(timer.last.memory.top_sites) == 1
+    assert timer.last.to_dict()["memory"]["retained"] == timer.last.memory.retained
+    assert len(parsed) == 1000
+
+
+def test_runner_memory_mode():
+    (task,) = runner.collect_tasks(
+        days=[8], input_name="puzzle_input.txt", parse_once=True, trace_memory=True
+    )
+    results = runner.run_task(task)
+    parse_result = next(result for result in results if result.part == "parse_model")
+    assert parse_result.memory.retained > 0
+    assert "day-8" in parse_result.memory.top_sites[0].location
+    assert "KiB" in runner.format_result(parse_result)
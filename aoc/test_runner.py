@@ -0,0 +1,48 @@
+from aoc import runner
+from aoc.days import PARTS, discover_days
+
+
+def answers(results):
+    return [result.answer for result in results if result.part in PARTS]
+
+
+def test_discover_days():
+    days = discover_days()
+    assert list(days) == sorted(days)
+    assert 1 in days
+    assert all((path / "main.py").is_file() for path in days.values())
+
+
+def test_run_task_with_sample_data():
+    tasks = runner.collect_tasks(days=[4], input_name="sample_data.txt")
+    assert [task.part for task in tasks] == ["first_part", "second_part"]
+    results = [result for task in tasks for result in runner.run_task(task)]
+    assert answers(results) == ["2", "4"]
+
+
+def test_run_task_parse_once():
+    (task,) = runner.collect_tasks(
+        days=[5], input_name="sample_data.txt", parse_once=True
+    )
+    results = runner.run_task(task)
+    assert [result.part for result in results] == [
+        "read",
+        "parse_model",
+        "first_part",
+        "second_part",
+    ]
+    assert answers(results) == ["CMZ", "MCD"]
+
+
+def test_run_task_parse_once_without_model():
+    (task,) = runner.collect_tasks(
+        days=[6], input_name="puzzle_input.txt", parse_once=True
+    )
+    results = runner.run_task(task)
+    assert [result.part for result in results] == ["read", "first_part", "second_part"]
+
+
+def test_run_tasks_on_process_pool():
+    tasks = runner.collect_tasks(days=[3, 5], input_name="sample_data.txt")
+    results = runner.run_tasks(tasks=tasks, max_workers=2)
+    assert answers(results) == ["157", "70", "CMZ", "MCD"]
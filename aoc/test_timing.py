@@ -0,0 +1,74 @@
+import json
+import pstats
+
+import pytest
+
+from aoc import runner
+from aoc.timing import PhaseTimer
+
+
+def test_phase():
+    timer = PhaseTimer()
+    with timer.phase("parse"):
+        pass
+    with timer.phase("solve"):
+        pass
+    assert [phase.name for phase in timer.phases] == ["parse", "solve"]
+    assert all(phase.elapsed >= 0 for phase in timer.phases)
+    assert timer.last.profile_path is None
+
+
+def test_phase_is_recorded_on_error():
+    timer = PhaseTimer()
+    with pytest.raises(ValueError):
+        with timer.phase("parse"):
+            raise ValueError()
+    assert timer.last.name == "parse"
+
+
+def test_timed():
+    timer = PhaseTimer()
+
+    @timer.timed()
+    def first_part(text: str) -> int:
+        return len(text)
+
+    @timer.timed(name="part 2")
+    def second_part(text: str) -> int:
+        return 2 * len(text)
+
+    assert first_part("abc") == 3
+    assert second_part("abc") == 6
+    assert [phase.name for phase in timer.phases] == ["first_part", "part 2"]
+    assert [entry["name"] for entry in json.loads(timer.to_json())] == [
+        "first_part",
+        "part 2",
+    ]
+
+
+def test_profile_dir(tmp_path):
+    timer = PhaseTimer(profile_dir=tmp_path / "profiles")
+    with timer.phase("solve"):
+        sum(range(1000))
+    assert timer.last.profile_path == tmp_path / "profiles" / "solve.prof"
+    assert pstats.Stats(str(timer.last.profile_path)).total_calls > 0
+
+
+def test_runner_phases(tmp_path):
+    (task,) = runner.collect_tasks(
+        days=[7], input_name="sample_data.txt", parse_once=True, profile_dir=tmp_path
+    )
+    results = runner.run_task(task)
+    assert [result.part for result in results] == [
+        "read",
+        "parse_model",
+        "first_part",
+        "second_part",
+    ]
+    assert all(result.profile_path.is_file() for result in results)
+
+    timings_path = tmp_path / "timings.json"
+    runner.write_timings(timings_path, results=results)
+    assert [entry["phase"] for entry in json.loads(timings_path.read_text())] == [
+        result.part for result in results
+    ]
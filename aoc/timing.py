@@ -0,0 +1,114 @@
+"""
+Timing of named phases such as reading, parsing and solving a day.
+
+Example::
+
+    timer = PhaseTimer(profile_dir=Path("profiles"))
+    with timer.phase("parse_model"):
+        model = parse_model(text)
+    print(timer.to_json())
+
+With a profile_dir each phase is also profiled with cProfile and its stats
+are dumped to ``<profile_dir>/<phase>.prof``. Profiled phases must not be
+nested as only one profiler can be active at a time.
+
+With a memory_tracer the allocations of each phase are traced as well, see
+aoc.memory. Tracing slows down the phases which inflates their wall times.
+"""
+import cProfile
+import functools
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from aoc.memory import MemoryTracer, PhaseMemory
+
+
+class Phase(NamedTuple):
+    name: str
+    elapsed: float
+    profile_path: Optional[Path] = None
+    memory: Optional[PhaseMemory] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        profile_path = None if self.profile_path is None else str(self.profile_path)
+        return {
+            "name": self.name,
+            "elapsed": self.elapsed,
+            "profile_path": profile_path,
+            "memory": None if self.memory is None else self.memory.to_dict(),
+        }
+
+
+class PhaseTimer:
+    """
+    Collect the wall times of phases in the order they finish.
+    """
+
+    def __init__(
+        self,
+        profile_dir: Optional[Path] = None,
+        memory_tracer: Optional[MemoryTracer] = None,
+    ):
+        self.profile_dir = profile_dir
+        self.memory_tracer = memory_tracer
+        self.phases: List[Phase] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        profile = None if self.profile_dir is None else cProfile.Profile()
+        tracing = (
+            nullcontext()
+            if self.memory_tracer is None
+            else self.memory_tracer.phase(name)
+        )
+        try:
+            # Snapshots of the tracer are taken outside of the timed section
+            with tracing:
+                start = time.perf_counter()
+                if profile is not None:
+                    profile.enable()
+                try:
+                    yield
+                finally:
+                    if profile is not None:
+                        profile.disable()
+                    elapsed = time.perf_counter() - start
+        finally:
+            profile_path = None
+            if profile is not None and self.profile_dir is not None:
+                self.profile_dir.mkdir(parents=True, exist_ok=True)
+                profile_path = self.profile_dir / f"{name}.prof"
+                profile.dump_stats(profile_path)
+            memory = (
+                None
+                if self.memory_tracer is None
+                else self.memory_tracer.phases[name]
+            )
+            self.phases.append(Phase(name, elapsed, profile_path, memory))
+
+    def timed(self, name: Optional[str] = None) -> Callable:
+        """
+        Decorate a function to time each of its calls as a phase.
+
+        The phase is named after the function unless name is given.
+        """
+
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.phase(function.__name__ if name is None else name):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @property
+    def last(self) -> Phase:
+        return self.phases[-1]
+
+    def to_json(self) -> str:
+        return json.dumps([phase.to_dict() for phase in self.phases], indent=2)
@@ -11,7 +11,7 @@
       mkshell = pkgs:
         let
           pythonWithPackages =
-            pkgs.python310.withPackages (p: with p; [ pytest ]);
+            pkgs.python310.withPackages (p: with p; [ pytest numpy ]);
         in pkgs.mkShell {
           # The development environment can contain any tools from nixpkgs
           packages = [ pythonWithPackages ];
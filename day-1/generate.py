@@ -0,0 +1,19 @@
+"""
+Generate calorie inventories of any size.
+"""
+import random
+from typing import Iterator
+
+SEED = 2022
+
+
+def generate_input(size: int, seed: int = SEED) -> Iterator[str]:
+    """
+    Yield the inventory of size elves line by line.
+    """
+    rng = random.Random(seed)
+    for elf_idx in range(size):
+        if elf_idx != 0:
+            yield "\n"
+        for _ in range(rng.randint(1, 15)):
+            yield f"{rng.randint(1000, 70000)}\n"
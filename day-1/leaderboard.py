@@ -0,0 +1,167 @@
+"""
+Incremental leaderboard of the elves carrying the most calories.
+
+Inventories that arrive as appended batches are fed to a Leaderboard as
+elf records or raw text chunks, and its compact state is saved between runs
+instead of summing the whole inventory again.
+
+Usage: python leaderboard.py STATE_PATH [BATCH_PATH ...]
+"""
+import heapq
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import main
+
+
+@dataclass
+class Leaderboard:
+    """
+    Keep the k largest calorie sums of the elves seen so far.
+
+    Only a min-heap of the k largest sums is stored, so adding an elf costs
+    O(log k). Text chunks may end in the middle of a line or an elf: the
+    unterminated line and the sum of the open elf are kept until the next
+    chunk continues them or finish closes the elf.
+    """
+
+    k: int = 3
+    top_sums: List[int] = field(default_factory=list)
+    most: Optional[int] = None
+    elf_count: int = 0
+    open_sum: Optional[int] = None
+    pending_line: str = ""
+
+    def __post_init__(self):
+        if self.k < 1:
+            raise ValueError(f"Expected k {self.k} to be positive.")
+        heapq.heapify(self.top_sums)
+
+    def add_elf(self, calories: Iterable[int]):
+        """
+        Add an elf from the calories of its items.
+        """
+        self.add_sum(sum(calories))
+
+    def add_sum(self, part_sum: int):
+        """
+        Add an elf from the sum of its calories.
+        """
+        main.push_part_sum(self.top_sums, part_sum, self.k)
+        self.most = part_sum if self.most is None else max(self.most, part_sum)
+        self.elf_count += 1
+
+    def feed(self, chunk: str):
+        """
+        Add the elves of a chunk of inventory text.
+        """
+        lines = (self.pending_line + chunk).split("\n")
+        # The last line is only complete once the next chunk starts
+        self.pending_line = lines.pop()
+        for line in lines:
+            if line.strip():
+                self.open_sum = int(line) + (self.open_sum or 0)
+            else:
+                self.close_open_elf()
+
+    def finish(self):
+        """
+        Close the elf of the last fed chunk at the end of the inventory.
+        """
+        self.feed("\n")
+        self.close_open_elf()
+
+    def close_open_elf(self):
+        if self.open_sum is not None:
+            self.add_sum(self.open_sum)
+        self.open_sum = None
+
+    def snapshot(self) -> "Leaderboard":
+        """
+        Copy the leaderboard with the open elf closed as if the inventory ended.
+        """
+        leaderboard = self.from_dict({**self.to_dict(), "top_sums": [*self.top_sums]})
+        leaderboard.finish()
+        return leaderboard
+
+    def top(self, k: Optional[int] = None) -> List[int]:
+        """
+        Get the k largest sums of the closed elves, largest first.
+        """
+        k = self.k if k is None else k
+        if not 1 <= k <= self.k:
+            raise ValueError(f"Expected k {k} to be between 1 and {self.k}.")
+        return heapq.nlargest(k, self.top_sums)
+
+    def top_total(self, k: Optional[int] = None) -> int:
+        """
+        Get the total calories of the k elves carrying the most.
+        """
+        return sum(self.top(k))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "k": self.k,
+            "top_sums": self.top_sums,
+            "most": self.most,
+            "elf_count": self.elf_count,
+            "open_sum": self.open_sum,
+            "pending_line": self.pending_line,
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "Leaderboard":
+        return cls(**state)
+
+    def save(self, file_path: Path):
+        """
+        Save the state as JSON to continue with the next batch.
+        """
+        file_path.write_text(json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, file_path: Path, k: int = 3) -> "Leaderboard":
+        """
+        Load a saved state or start an empty leaderboard if there is none.
+        """
+        if not file_path.exists():
+            return cls(k=k)
+        leaderboard = cls.from_dict(json.loads(file_path.read_text()))
+        if leaderboard.k != k:
+            raise ValueError(
+                f"Expected saved k {leaderboard.k} to match requested k {k}."
+            )
+        return leaderboard
+
+
+def update(state_path: Path, batch_paths: Iterable[Path]) -> Leaderboard:
+    """
+    Feed batches of inventory text to the saved leaderboard and save it.
+
+    Each batch is read in chunks so that batches need not fit in memory.
+    """
+    leaderboard = Leaderboard.load(state_path)
+    for batch_path in batch_paths:
+        with batch_path.open() as handle:
+            for chunk in iter(lambda: handle.read(2**20), ""):
+                leaderboard.feed(chunk)
+    leaderboard.save(state_path)
+    return leaderboard
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        raise ValueError("Expected a state filepath to be passed as argument.")
+    # The last elf may continue in the next batch so it is only closed for output
+    leaderboard = update(
+        Path(sys.argv[1]), [Path(arg) for arg in sys.argv[2:]]
+    ).snapshot()
+    if leaderboard.elf_count > 0:
+        print(f"The elf is carrying a total of {leaderboard.most} calories.")
+        print(
+            "The top three elves are carrying a total of "
+            f"{leaderboard.top_total()} calories."
+        )
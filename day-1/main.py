@@ -1,28 +1,165 @@
 """
 Main script.
 """
+import heapq
+import mmap
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from textwrap import dedent
 
 from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 
-def main(file_path: Path):
-    text = file_path.read_text()
-    assert len(text) > 0
+def top_part_sums(lines: Iterable[Union[str, bytes]], k: int = 3) -> List[int]:
+    """
+    Sum the calories of each elf while reading lines and keep the k largest.
 
-    parts = text.split("\n\n")
+    Only a min-heap of the k largest sums is kept in memory, so that no list
+    of all elves is built or sorted. The sums are returned largest first.
+    """
+    if k < 1:
+        raise ValueError(f"Expected k {k} to be positive.")
+    top_sums: List[int] = []
+    part_sum = None
+    for line in lines:
+        if line.strip():
+            part_sum = int(line) + (0 if part_sum is None else part_sum)
+            continue
+        if part_sum is not None:
+            push_part_sum(top_sums, part_sum, k)
+        part_sum = None
+    if part_sum is not None:
+        push_part_sum(top_sums, part_sum, k)
 
-    assert len(parts) < len(text.splitlines())
+    return sorted(top_sums, reverse=True)
 
-    part_sums = [sum([int(value) for value in part.splitlines()]) for part in parts]
+
+def push_part_sum(top_sums: List[int], part_sum: int, k: int):
+    if len(top_sums) < k:
+        heapq.heappush(top_sums, part_sum)
+    elif part_sum > top_sums[0]:
+        heapq.heapreplace(top_sums, part_sum)
+
+
+def first_part(text: str) -> int:
+    """
+    Solve first part.
+    """
+    return top_part_sums(text.splitlines(), k=1)[0]
+
+
+def second_part(text: str) -> int:
+    """
+    Solve second part.
+    """
+    return sum(top_part_sums(text.splitlines(), k=3))
+
+
+def solve_lines(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Solve both parts in a single pass over the lines of the inventory.
+    """
+    top_three = top_part_sums(lines, k=3)
+    return top_three[0], sum(top_three)
+
+
+def elf_aligned_ranges(
+    mapped: Union[mmap.mmap, bytes], range_count: int
+) -> List[Tuple[int, int]]:
+    """
+    Split into at most range_count byte ranges that each start at an elf.
+
+    Each split point is moved forward to just after the next blank line so
+    that no elf is split between two ranges.
+    """
+    size = len(mapped)
+    starts = [0]
+    for idx in range(1, range_count):
+        target = max(size * idx // range_count, starts[-1])
+        separator = mapped.find(b"\n\n", target)
+        if separator == -1:
+            break
+        if separator + 2 > starts[-1]:
+            starts.append(separator + 2)
+    ends = [*starts[1:], size]
+    return [(start, end) for start, end in zip(starts, ends) if start < end]
+
+
+def iter_range_lines(
+    mapped: Union[mmap.mmap, bytes], start: int, end: int, block_size: int = 2**20
+) -> Iterator[bytes]:
+    """
+    Yield the lines between start and end a block of whole lines at a time.
+
+    Only one block is copied out of the mapping at a time. Day 3 has a copy
+    of this function, as each day runs as a standalone script.
+    """
+    while start < end:
+        block_end = min(start + block_size, end)
+        if block_end < end:
+            newline = mapped.rfind(b"\n", start, block_end)
+            if newline == -1:
+                # Line longer than a block
+                newline = mapped.find(b"\n", block_end, end)
+            block_end = end if newline == -1 else newline + 1
+        yield from mapped[start:block_end].splitlines()
+        start = block_end
+
+
+def range_top_part_sums(file_path: Path, start: int, end: int, k: int) -> List[int]:
+    """
+    Find the k largest sums of the elves in a byte range of a file.
+
+    The first of the sums is the largest one of the range.
+    """
+    with file_path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return top_part_sums(iter_range_lines(mapped, start, end), k=k)
+
+
+def parallel_top_part_sums(
+    file_path: Path,
+    k: int = 3,
+    workers: Optional[int] = None,
+    range_count: Optional[int] = None,
+) -> List[int]:
+    """
+    Find the k largest sums by summing ranges of the file in worker processes.
+
+    The file is memory-mapped to find range boundaries and each worker maps
+    it again to sum its own range. By default there is a range per worker.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    range_count = workers if range_count is None else range_count
+    with file_path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            ranges = elf_aligned_ranges(mapped, range_count=range_count)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        range_sums = executor.map(
+            range_top_part_sums,
+            *zip(*[(file_path, start, end, k) for start, end in ranges]),
+        )
+        return heapq.nlargest(k, chain.from_iterable(range_sums))
+
+
+def main(file_path: Path, workers: Optional[int] = None):
+    if workers is None:
+        # Lines are streamed from the file as the inventory may not fit in memory
+        with file_path.open() as handle:
+            most, sum_of_top_three = solve_lines(handle)
+    else:
+        top_three = parallel_top_part_sums(file_path, k=3, workers=workers)
+        most, sum_of_top_three = top_three[0], sum(top_three)
+    assert most > 0
 
     # Part 1 answer
-    most = max(part_sums)
     part_1_answer = f"The elf is carrying a total of {most} calories."
 
     # Part 2 answer
-    sum_of_top_three = sum(sorted(part_sums, reverse=True)[0:3])
     part_2_answer = (
         f"The top three elves are carrying a total of {sum_of_top_three} calories."
     )
@@ -40,4 +177,6 @@ if __name__ == "__main__":
     if len(file_path_arg) == 0:
         raise ValueError("Expected a filepath to be passed as argument.")
     file_path = Path(file_path_arg)
-    print(main(file_path=file_path))
+    # Optional second argument sums the file in that many worker processes
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    print(main(file_path=file_path, workers=workers))
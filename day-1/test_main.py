@@ -0,0 +1,149 @@
+from pathlib import Path
+from typing import List
+
+import main
+import pytest
+
+SAMPLE_DATA_PATH = Path(__file__).parent / "sample_data.txt"
+PUZZLE_INPUT_PATH = Path(__file__).parent / "puzzle_input.txt"
+
+
+@pytest.mark.parametrize(
+    "k,answer",
+    [
+        (1, [24000]),
+        (3, [24000, 11000, 10000]),
+        (10, [24000, 11000, 10000, 6000, 4000]),
+    ],
+)
+def test_top_part_sums(k: int, answer: List[int]):
+    lines = SAMPLE_DATA_PATH.read_text().splitlines()
+    assert main.top_part_sums(lines, k=k) == answer
+
+
+def test_top_part_sums_with_repeated_blank_lines():
+    lines = ["1", "", "", "2", "3", "\n", "4", ""]
+    assert main.top_part_sums(lines, k=3) == [5, 4, 1]
+
+
+def test_top_part_sums_with_invalid_k():
+    with pytest.raises(ValueError):
+        main.top_part_sums([], k=0)
+
+
+def test_first_part_with_sample_data():
+    assert main.first_part(SAMPLE_DATA_PATH.read_text()) == 24000
+
+
+def test_second_part_with_sample_data():
+    assert main.second_part(SAMPLE_DATA_PATH.read_text()) == 45000
+
+
+def test_main_with_puzzle_input():
+    lines = main.main(PUZZLE_INPUT_PATH).split("\n")
+    assert "70116 calories" in lines[1]
+    assert "206582 calories" in lines[2]
+
+
+@pytest.mark.parametrize("range_count", [1, 2, 7, 1000])
+def test_elf_aligned_ranges(range_count: int):
+    data = PUZZLE_INPUT_PATH.read_bytes()
+    ranges = main.elf_aligned_ranges(data, range_count=range_count)
+    assert 1 <= len(ranges) <= range_count
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[start - 2 : start] == b"\n\n"
+
+
+@pytest.mark.parametrize("range_count", [1, 3, 50])
+def test_parallel_top_part_sums(range_count: int):
+    assert main.parallel_top_part_sums(
+        PUZZLE_INPUT_PATH, k=3, workers=2, range_count=range_count
+    ) == main.top_part_sums(PUZZLE_INPUT_PATH.read_text().splitlines(), k=3)
+
+
+def test_main_in_parallel_with_puzzle_input():
+    assert main.main(PUZZLE_INPUT_PATH, workers=2) == main.main(PUZZLE_INPUT_PATH)
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 7, 2**20])
+def test_iter_range_lines(block_size: int):
+    data = b"1\n22\n\n333\n4444\n"
+    assert list(main.iter_range_lines(data, 0, len(data), block_size)) == [
+        b"1",
+        b"22",
+        b"",
+        b"333",
+        b"4444",
+    ]
+    assert list(main.iter_range_lines(data, 6, 10, block_size)) == [b"333"]
+
+
+@pytest.mark.parametrize("file_path", [SAMPLE_DATA_PATH, PUZZLE_INPUT_PATH])
+def test_vectorized_matches_main(file_path: Path):
+    pytest.importorskip("numpy")
+    import vectorized
+
+    text = file_path.read_text()
+    assert vectorized.solve_file(file_path) == (
+        main.first_part(text),
+        main.second_part(text),
+    )
+    assert vectorized.solve_text(text.rstrip("\n")) == vectorized.solve_file(file_path)
+
+
+@pytest.mark.parametrize("text", ["1\n2\nx\n", "1 2\n", "1234567890123456789\n"])
+def test_vectorized_rejects_invalid_inventory(text: str):
+    pytest.importorskip("numpy")
+    import vectorized
+
+    with pytest.raises(ValueError):
+        vectorized.solve_text(text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_leaderboard_fed_in_chunks_matches_main(chunk_size: int):
+    import leaderboard
+
+    text = PUZZLE_INPUT_PATH.read_text()
+    board = leaderboard.Leaderboard(k=3)
+    for start in range(0, len(text), chunk_size):
+        board.feed(text[start : start + chunk_size])
+    board.finish()
+    assert board.most == main.first_part(text)
+    assert board.top_total() == main.second_part(text)
+    assert board.top_total(k=1) == board.most
+
+
+def test_leaderboard_with_elf_records():
+    import leaderboard
+
+    board = leaderboard.Leaderboard(k=2)
+    for calories in [[1000, 2000], [5000], [], [100]]:
+        board.add_elf(calories)
+    assert board.top() == [5000, 3000]
+    assert board.elf_count == 4
+    with pytest.raises(ValueError):
+        board.top(k=3)
+
+
+def test_leaderboard_state_persists_between_batches(tmp_path: Path):
+    import leaderboard
+
+    state_path = tmp_path / "state.json"
+    lines = SAMPLE_DATA_PATH.read_text().splitlines(keepends=True)
+    batch_paths = []
+    # Batches are split in the middle of an elf
+    for idx, batch_lines in enumerate([lines[:4], lines[4:9], lines[9:]]):
+        batch_path = tmp_path / f"batch_{idx}.txt"
+        batch_path.write_text("".join(batch_lines))
+        batch_paths.append(batch_path)
+        board = leaderboard.update(state_path, [batch_path])
+
+    assert board.open_sum is not None
+    assert board.snapshot().top() == [24000, 11000, 10000]
+    assert leaderboard.Leaderboard.load(state_path) == board
+    with pytest.raises(ValueError):
+        leaderboard.Leaderboard.load(state_path, k=1)
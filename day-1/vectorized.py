@@ -0,0 +1,84 @@
+"""
+NumPy backend that parses and sums the whole inventory in vectorized passes.
+
+The input is held in memory as bytes together with a few integer arrays
+the size of the line count, so it suits inventories that fit in memory.
+Inventories larger than that are better summed with parallel_top_part_sums
+of main.
+"""
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+NEWLINE = ord("\n")
+ZERO = ord("0")
+# Larger calorie values would overflow int64
+MAX_DIGITS = 18
+
+
+def parse_lines(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse every line of the uint8 data to an integer, blank lines to zero.
+
+    Instead of computing a place value for every byte, the digits of all
+    lines are gathered one place at a time, counting back from the newlines.
+    This loops at most MAX_DIGITS times and keeps the temporaries the size
+    of the line count. Returns the values and whether each line is blank.
+    """
+    if len(data) == 0 or data[-1] != NEWLINE:
+        data = np.append(data, np.uint8(NEWLINE))
+    is_newline = data == NEWLINE
+    if np.any(~is_newline & ((data < ZERO) | (data > ZERO + 9))):
+        raise ValueError("Expected the inventory to only contain digits and newlines.")
+
+    newline_positions = np.flatnonzero(is_newline)
+    line_starts = np.concatenate(([0], newline_positions[:-1] + 1))
+    line_lengths = newline_positions - line_starts
+    if line_lengths.max() > MAX_DIGITS:
+        raise ValueError(f"Expected calorie values of at most {MAX_DIGITS} digits.")
+
+    digits = data - np.uint8(ZERO)
+    values = np.zeros(len(newline_positions), dtype=np.int64)
+    for place in range(line_lengths.max()):
+        place_digits = digits.take(newline_positions - 1 - place)
+        # Lines too short for the place would take digits of the line before
+        place_digits[line_lengths <= place] = 0
+        values += place_digits.astype(np.int64) * 10**place
+    return values, line_lengths == 0
+
+
+def elf_totals(data: np.ndarray) -> np.ndarray:
+    """
+    Sum the calories of each elf, elves being separated by blank lines.
+
+    Blank lines add zero to the elf before them.
+    """
+    values, is_blank = parse_lines(data)
+    elf_starts = np.concatenate(([0], np.flatnonzero(is_blank) + 1))
+    elf_starts = elf_starts[elf_starts < len(values)]
+    return np.add.reduceat(values, elf_starts)
+
+
+def top_totals(totals: np.ndarray, k: int = 3) -> np.ndarray:
+    """
+    Select the k largest totals, largest first, without a full sort.
+    """
+    k = min(k, len(totals))
+    return np.sort(np.partition(totals, len(totals) - k)[len(totals) - k :])[::-1]
+
+
+def solve_data(data: np.ndarray) -> Tuple[int, int]:
+    top_three = top_totals(elf_totals(data), k=3)
+    return int(top_three[0]), int(top_three.sum())
+
+
+def solve_text(text: str) -> Tuple[int, int]:
+    """
+    Solve both parts like first_part and second_part of main.
+    """
+    return solve_data(np.frombuffer(text.encode(), dtype=np.uint8))
+
+
+def solve_file(file_path: Path) -> Tuple[int, int]:
+    return solve_data(np.fromfile(file_path, dtype=np.uint8))
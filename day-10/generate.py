@@ -0,0 +1,27 @@
+"""
+Generate CPU programs of any size.
+"""
+import random
+from typing import Iterator
+
+SEED = 2022
+# The first part samples the register up to cycle 220
+MIN_INSTRUCTION_COUNT = 220
+SCREEN_WIDTH = 40
+
+
+def generate_input(size: int, seed: int = SEED) -> Iterator[str]:
+    """
+    Yield a program of size instructions, at least MIN_INSTRUCTION_COUNT.
+
+    The register is kept within the screen so that the sprite stays visible.
+    """
+    rng = random.Random(seed)
+    x = 1
+    for _ in range(max(size, MIN_INSTRUCTION_COUNT)):
+        if rng.random() < 0.3:
+            yield "noop\n"
+            continue
+        value = rng.randint(max(-10, -x), min(10, SCREEN_WIDTH - 1 - x))
+        x += value
+        yield f"addx {value}\n"
@@ -13,7 +13,18 @@ from functools import reduce, total_ordering
 from itertools import accumulate, compress
 from pathlib import Path
 from textwrap import dedent
-from typing import Dict, List, NamedTuple, Optional, Set, Tuple, TypedDict, Union
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 
 @unique
@@ -60,15 +71,34 @@ def apply_instructions(
     return cycle_states
 
 
-def first_part(text: str) -> int:
+def iter_cycle_states(
+    instructions: Iterable[Instruction], starting_x: int = 1
+) -> Iterator[int]:
     """
-    Solve first part.
+    Yield the same states as apply_instructions without keeping them.
     """
+    x = starting_x
+    yield x
+    for instruction in instructions:
+        for _ in range(instruction.instruction_type.value[1] - 1):
+            yield x
+        x += instruction.value
+        yield x
+
 
+def parse_model(text: str) -> List[int]:
+    """
+    Parse text and run the program into the cycle states shared by both parts.
+    """
     instructions = [parse_line(line=line) for line in text.splitlines()]
 
-    cycle_states = apply_instructions(instructions=instructions)
+    return apply_instructions(instructions=instructions)
+
 
+def first_part_from_model(cycle_states: List[int]) -> int:
+    """
+    Solve first part from the cycle states of the program.
+    """
     cycle_indexes = (20, 60, 100, 140, 180, 220)
 
     cycle_values = []
@@ -83,21 +113,24 @@ def first_part(text: str) -> int:
     return sum(cycle_values)
 
 
-def second_part(text: str) -> str:
+def first_part(text: str) -> int:
     """
-    Solve second part.
+    Solve first part.
     """
-    instructions = [parse_line(line=line) for line in text.splitlines()]
+    return first_part_from_model(parse_model(text=text))
 
-    cycle_states = apply_instructions(instructions=instructions)
 
+def second_part_from_model(cycle_states: List[int]) -> str:
+    """
+    Solve second part from the cycle states of the program.
+    """
     rows = []
     row = ""
     for idx, state in enumerate(cycle_states):
         row_idx = idx % 40
         if row_idx == 0 and idx != 0:
             rows.append(row)
-            print(f"Finished row: {row}")
+            logging.info(f"Finished row: {row}")
             row = ""
 
         draw_indexes = range(state - 1, state + 2)
@@ -108,17 +141,51 @@ def second_part(text: str) -> str:
     return "\n".join(rows)
 
 
+def second_part(text: str) -> str:
+    """
+    Solve second part.
+    """
+    return second_part_from_model(parse_model(text=text))
+
+
+def solve_lines(lines: Iterable[str]) -> Tuple[int, str]:
+    """
+    Solve both parts in a single pass over the program lines.
+
+    The cycle states are consumed as they are produced instead of being
+    collected into a list first.
+    """
+    cycle_indexes = (20, 60, 100, 140, 180, 220)
+    instructions = (parse_line(line=line) for line in lines)
+
+    signal_strength = 0
+    rows = []
+    row = ""
+    for idx, state in enumerate(iter_cycle_states(instructions=instructions)):
+        if idx + 1 in cycle_indexes:
+            signal_strength += state * (idx + 1)
+
+        row_idx = idx % 40
+        if row_idx == 0 and idx != 0:
+            rows.append(row)
+            row = ""
+
+        row += "#" if row_idx in range(state - 1, state + 2) else "."
+    return signal_strength, "\n".join(rows)
+
+
 if __name__ == "__main__":
     file_path_arg = sys.argv[1]
     if len(file_path_arg) == 0:
         raise ValueError("Expected a filepath to be passed as argument.")
     file_path = Path(file_path_arg)
     text = file_path.read_text()
+    model = parse_model(text=text)
 
-    first_part_answer = first_part(text=text)
+    first_part_answer = first_part_from_model(model)
 
     print(f"Answer to first part: {first_part_answer}")
 
-    second_part_answer = second_part(text=text)
+    second_part_answer = second_part_from_model(model)
 
     print(f"Answer to second part:\n\n{second_part_answer}")
@@ -0,0 +1,42 @@
+"""
+Generate monkey notes for any number of monkeys.
+"""
+import random
+from typing import Iterator
+
+SEED = 2022
+# Divisors are reused so that their least common multiple stays small
+DIVISORS = (2, 3, 5, 7, 11, 13, 17, 19, 23)
+
+
+def generate_input(size: int, seed: int = SEED) -> Iterator[str]:
+    """
+    Yield the notes of size monkeys, at least two, line by line.
+
+    The ``old * old`` operation is not generated as repeated squaring makes
+    worry levels overflow within the twenty rounds of the first part.
+    """
+    rng = random.Random(seed)
+    monkey_count = max(size, 2)
+    for monkey_id in range(monkey_count):
+        if monkey_id != 0:
+            yield "\n"
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        operation = rng.choice(
+            (f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}")
+        )
+        # Monkeys never throw to themselves and only the first monkey throws
+        # forward. Each item is thus inspected at most twice per round which
+        # keeps the float division of the first part from overflowing.
+        true_target, false_target = (
+            rng.randint(1, monkey_count - 1)
+            if monkey_id == 0
+            else rng.randrange(monkey_id)
+            for _ in range(2)
+        )
+        yield f"Monkey {monkey_id}:\n"
+        yield f"  Starting items: {items}\n"
+        yield f"  Operation: new = {operation}\n"
+        yield f"  Test: divisible by {DIVISORS[monkey_id % len(DIVISORS)]}\n"
+        yield f"    If true: throw to monkey {true_target}\n"
+        yield f"    If false: throw to monkey {false_target}\n"
@@ -189,9 +189,9 @@ def parse_monkey_and_items(monkey_text: str) -> Tuple[Monkey, List[int]]:
     )
 
 
-def first_part(text: str) -> int:
+def parse_model(text: str) -> Tuple[List[Monkey], List[List[int]]]:
     """
-    Solve first part.
+    Parse text into the monkeys and their items shared by both parts.
     """
     monkeys, all_items = [], []
 
@@ -199,7 +199,25 @@ def first_part(text: str) -> int:
         monkey, monkey_items = parse_monkey_and_items(monkey_text=monkey_text)
         monkeys.append(monkey)
         all_items.append(monkey_items)
-    monkey_party = MonkeyParty(monkeys=monkeys, monkey_items=all_items)
+    return monkeys, all_items
+
+
+def start_party(model: Tuple[List[Monkey], List[List[int]]]) -> MonkeyParty:
+    """
+    Start a party with copies of the items as rounds mutate them.
+    """
+    monkeys, all_items = model
+    return MonkeyParty(
+        monkeys=monkeys,
+        monkey_items=[monkey_items.copy() for monkey_items in all_items],
+    )
+
+
+def first_part_from_model(model: Tuple[List[Monkey], List[List[int]]]) -> int:
+    """
+    Solve first part from parsed monkeys and items.
+    """
+    monkey_party = start_party(model=model)
 
     for _ in range(20):
         monkey_party.round()
@@ -210,40 +228,49 @@ def first_part(text: str) -> int:
     return sorted_counts[-2] * sorted_counts[-1]
 
 
-def second_part(text: str) -> int:
+def first_part(text: str) -> int:
     """
-    Solve second part.
+    Solve first part.
     """
-    monkeys, all_items = [], []
+    return first_part_from_model(parse_model(text=text))
 
-    for monkey_text in text.split("\n\n"):
-        monkey, monkey_items = parse_monkey_and_items(monkey_text=monkey_text)
-        monkeys.append(monkey)
-        all_items.append(monkey_items)
-    monkey_party = MonkeyParty(monkeys=monkeys, monkey_items=all_items)
+
+def second_part_from_model(model: Tuple[List[Monkey], List[List[int]]]) -> int:
+    """
+    Solve second part from parsed monkeys and items.
+    """
+    monkey_party = start_party(model=model)
 
     for _ in range(10000):
         monkey_party.round(no_division=True)
 
-    print(monkey_party.inspection_counts)
+    logging.info(f"Inspection counts: {monkey_party.inspection_counts}")
     # Order is ascending by default
     sorted_counts = sorted(monkey_party.inspection_counts.values())
 
-    print(sorted_counts)
+    logging.info(f"Sorted inspection counts: {sorted_counts}")
     return sorted_counts[-2] * sorted_counts[-1]
 
 
+def second_part(text: str) -> int:
+    """
+    Solve second part.
+    """
+    return second_part_from_model(parse_model(text=text))
+
+
 if __name__ == "__main__":
     file_path_arg = sys.argv[1]
     if len(file_path_arg) == 0:
         raise ValueError("Expected a filepath to be passed as argument.")
     file_path = Path(file_path_arg)
     text = file_path.read_text()
+    model = parse_model(text=text)
 
-    first_part_answer = first_part(text=text)
+    first_part_answer = first_part_from_model(model)
 
     print(f"Answer to first part: {first_part_answer}")
 
-    second_part_answer = second_part(text=text)
+    second_part_answer = second_part_from_model(model)
 
     print(f"Answer to second part:\n\n{second_part_answer}")
@@ -49,3 +49,9 @@ def test_part_1_puzzle_input():
 
 def test_part_2():
     assert main.second_part(SAMPLE_DATA_PATH.read_text()) == 2713310158
+
+
+def test_both_parts_from_shared_model():
+    model = main.parse_model(SAMPLE_DATA_PATH.read_text())
+    assert main.first_part_from_model(model) == 10605
+    assert main.second_part_from_model(model) == 2713310158
@@ -0,0 +1,16 @@
+"""
+Generate rock-paper-scissors strategy guides of any size.
+"""
+import random
+from typing import Iterator
+
+SEED = 2022
+
+
+def generate_input(size: int, seed: int = SEED) -> Iterator[str]:
+    """
+    Yield a strategy guide of size rounds line by line.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}\n"
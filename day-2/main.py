@@ -2,10 +2,11 @@
 Main script.
 """
 import sys
+from collections import Counter
 from textwrap import dedent
 from enum import Enum, unique
-from dataclasses import dataclass
-from typing import NamedTuple, Set
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, NamedTuple, Optional, Sequence, Set, Tuple
 from functools import total_ordering
 import logging
 
@@ -126,17 +127,239 @@ def resolve_match_from_result(line: str):
     return total_score_for_round
 
 
-def main(file_path: Path):
-    text = file_path.read_text()
-    assert len(text) > 0
+OPPONENT_CODES = ("A", "B", "C")
+OWN_CODES = ("X", "Y", "Z")
 
-    part_1_total_score = sum([resolve_match(line) for line in text.splitlines()])
 
-    part_1_answer = f"The total sum from the strategy in part 1 is {part_1_total_score}"
+@dataclass
+class Tournament:
+    """
+    Score rounds of any odd number of shapes with modular arithmetic.
+
+    Shapes are indexed in order so that each shape beats the shapes an odd
+    number of steps behind it and loses to the ones an even number of steps
+    behind. With five shapes the order is rock, paper, scissors, Spock and
+    lizard. The wanted results of the second part are offsets from the shape
+    of the opponent to the shape to choose.
+    """
 
-    part_2_total_score = sum(
-        [resolve_match_from_result(line) for line in text.splitlines()]
+    opponent_symbols: Sequence[str] = OPPONENT_CODES
+    own_symbols: Sequence[str] = OWN_CODES
+    result_offsets: Dict[str, int] = field(
+        default_factory=lambda: {"X": -1, "Y": 0, "Z": 1}
     )
+    opponent_indexes: Dict[str, int] = field(init=False)
+    own_indexes: Dict[str, int] = field(init=False)
+
+    def __post_init__(self):
+        shape_count = len(self.opponent_symbols)
+        if shape_count < 3 or shape_count % 2 == 0:
+            raise ValueError(f"Expected an odd number of shapes, got {shape_count}.")
+        if len(self.own_symbols) != shape_count:
+            raise ValueError(
+                f"Expected {shape_count} own symbols, got {len(self.own_symbols)}."
+            )
+        self.opponent_indexes = {
+            symbol: idx for idx, symbol in enumerate(self.opponent_symbols)
+        }
+        self.own_indexes = {symbol: idx for idx, symbol in enumerate(self.own_symbols)}
+
+    @property
+    def shape_count(self) -> int:
+        return len(self.opponent_symbols)
+
+    def result(self, opponent: int, own: int) -> Results:
+        """
+        Resolve who wins from the number of steps between the shapes.
+        """
+        steps = (own - opponent) % self.shape_count
+        if steps == 0:
+            return Results.TIE
+        return Results.WIN if steps % 2 == 1 else Results.LOSS
+
+    def score(self, opponent: int, own: int) -> int:
+        return own + 1 + self.result(opponent=opponent, own=own).value.score
+
+    def parse_line(self, line: str) -> Tuple[str, str]:
+        codes = line.split(" ")
+        if len(codes) != 2:
+            raise ValueError(f"Expected line {line!r} to have two codes.")
+        return codes[0], codes[1]
+
+    def resolve_match(self, line: str) -> int:
+        """
+        Score a round in which the second code is the shape to choose.
+        """
+        opponent, own = self.parse_line(line)
+        try:
+            return self.score(self.opponent_indexes[opponent], self.own_indexes[own])
+        except KeyError:
+            raise ValueError(f"Expected codes of line {line!r} to be configured.")
+
+    def choose_shape(self, opponent: int, wanted_result: str) -> int:
+        """
+        Choose the shape an offset of the wanted result away from the opponent.
+        """
+        return (opponent + self.result_offsets[wanted_result]) % self.shape_count
+
+    def resolve_match_from_result(self, line: str) -> int:
+        """
+        Score a round in which the second code is the wanted result.
+        """
+        opponent, wanted_result = self.parse_line(line)
+        try:
+            opponent_idx = self.opponent_indexes[opponent]
+            own = self.choose_shape(opponent_idx, wanted_result)
+        except KeyError:
+            raise ValueError(f"Expected codes of line {line!r} to be configured.")
+        return self.score(opponent_idx, own)
+
+    def solve_lines(self, lines: Iterable[str]) -> Tuple[int, int]:
+        """
+        Solve both parts in a single pass over the lines of the strategy guide.
+        """
+        part_1_total_score, part_2_total_score = 0, 0
+        for line in lines:
+            part_1_total_score += self.resolve_match(line)
+            part_2_total_score += self.resolve_match_from_result(line)
+        return part_1_total_score, part_2_total_score
+
+
+def build_score_table() -> Dict[str, Tuple[int, int]]:
+    """
+    Score every possible line with the enum model for both parts.
+
+    There are only nine possible lines, so they are scored once and the
+    scores of each line are then looked up instead of resolved again.
+    """
+    return {
+        f"{opponent} {own}": (
+            resolve_match(f"{opponent} {own}"),
+            resolve_match_from_result(f"{opponent} {own}"),
+        )
+        for opponent in OPPONENT_CODES
+        for own in OWN_CODES
+    }
+
+
+SCORE_TABLE = build_score_table()
+
+
+def line_scores(line: str) -> Tuple[int, int]:
+    """
+    Look up the scores of a line for both parts.
+    """
+    try:
+        return SCORE_TABLE[line]
+    except KeyError:
+        raise ValueError(f"Expected line {line!r} to be one of {list(SCORE_TABLE)}.")
+
+
+def first_part(text: str) -> int:
+    """
+    Solve first part.
+    """
+    return sum([line_scores(line)[0] for line in text.splitlines()])
+
+
+def second_part(text: str) -> int:
+    """
+    Solve second part.
+    """
+    return sum([line_scores(line)[1] for line in text.splitlines()])
+
+
+def solve_lines(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Solve both parts in a single pass over the lines of the strategy guide.
+    """
+    part_1_total_score, part_2_total_score = 0, 0
+    for line in lines:
+        part_1_score, part_2_score = line_scores(line)
+        part_1_total_score += part_1_score
+        part_2_total_score += part_2_score
+    return part_1_total_score, part_2_total_score
+
+
+LINE_KEYS = {line.encode(): line for line in SCORE_TABLE}
+
+# Every line is two codes and a space followed by a line ending
+KEY_SIZE = 3
+
+
+def detect_line_ending(data: bytes) -> bytes:
+    """
+    Detect whether the lines of a guide end in LF or in CRLF.
+    """
+    return b"\r\n" if data[KEY_SIZE : KEY_SIZE + 2] == b"\r\n" else b"\n"
+
+
+def count_lines(data: bytes, line_ending: Optional[bytes] = None) -> Counter:
+    """
+    Count how many times each possible line occurs in the raw bytes of a guide.
+
+    Each line is counted with a bytes search so no object is built per line.
+    The line endings must be every line size bytes so that each counted line
+    is a whole line of its own. By default the line ending is detected from
+    the first line.
+    """
+    line_ending = detect_line_ending(data) if line_ending is None else line_ending
+    line_size = KEY_SIZE + len(line_ending)
+    counts = Counter({line: data.count(key) for key, line in LINE_KEYS.items()})
+    # The last line may be without a line ending
+    line_count = (len(data) + len(line_ending)) // line_size
+    if (
+        len(data) % line_size not in (0, KEY_SIZE)
+        or any(
+            data[KEY_SIZE + idx :: line_size].strip(line_ending[idx : idx + 1])
+            for idx in range(len(line_ending))
+        )
+        or sum(counts.values()) != line_count
+    ):
+        raise ValueError(f"Expected every line to be one of {list(SCORE_TABLE)}.")
+    return counts
+
+
+def score_counts(counts: Counter) -> Tuple[int, int]:
+    """
+    Score both parts from the number of times each line occurs.
+    """
+    return (
+        sum(count * SCORE_TABLE[line][0] for line, count in counts.items()),
+        sum(count * SCORE_TABLE[line][1] for line, count in counts.items()),
+    )
+
+
+def solve_bytes(data: bytes) -> Tuple[int, int]:
+    """
+    Solve both parts from the raw bytes of the strategy guide.
+    """
+    return score_counts(count_lines(data))
+
+
+def solve_file(file_path: Path, block_size: int = 2**24) -> Tuple[int, int]:
+    """
+    Solve both parts by counting the lines of the file a block at a time.
+
+    The line ending is detected from the first line. Blocks are a multiple of
+    the line size, so that they always start at a line, and only one block is
+    held in memory at a time.
+    """
+    counts: Counter = Counter()
+    with file_path.open("rb") as handle:
+        line_ending = detect_line_ending(handle.peek(KEY_SIZE + 2))
+        block_size -= block_size % (KEY_SIZE + len(line_ending))
+        for block in iter(lambda: handle.read(block_size), b""):
+            counts.update(count_lines(block, line_ending=line_ending))
+    return score_counts(counts)
+
+
+def main(file_path: Path):
+    assert file_path.stat().st_size > 0
+
+    part_1_total_score, part_2_total_score = solve_file(file_path)
+
+    part_1_answer = f"The total sum from the strategy in part 1 is {part_1_total_score}"
 
     part_2_answer = f"The total sum from the strategy in part 2 is {part_2_total_score}"
 
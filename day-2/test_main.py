@@ -0,0 +1,154 @@
+from pathlib import Path
+
+import main
+import pytest
+
+SAMPLE_DATA_PATH = Path(__file__).parent / "sample_data.txt"
+PUZZLE_INPUT_PATH = Path(__file__).parent / "puzzle_input.txt"
+
+
+def test_first_part_with_sample_data():
+    assert main.first_part(SAMPLE_DATA_PATH.read_text()) == 15
+
+
+def test_second_part_with_sample_data():
+    assert main.second_part(SAMPLE_DATA_PATH.read_text()) == 12
+
+
+@pytest.mark.parametrize("line", list(main.SCORE_TABLE))
+def test_score_table_matches_enum_model(line: str):
+    assert main.line_scores(line) == (
+        main.resolve_match(line),
+        main.resolve_match_from_result(line),
+    )
+
+
+def test_solve_lines_matches_enum_model():
+    lines = PUZZLE_INPUT_PATH.read_text().splitlines()
+    assert main.solve_lines(lines) == (
+        sum(main.resolve_match(line) for line in lines),
+        sum(main.resolve_match_from_result(line) for line in lines),
+    )
+
+
+@pytest.mark.parametrize("line", ["A W", "AX", "A X ", ""])
+def test_line_scores_with_invalid_line(line: str):
+    with pytest.raises(ValueError):
+        main.line_scores(line)
+
+
+@pytest.mark.parametrize("block_size", [4, 9, 2**24])
+@pytest.mark.parametrize("file_path", [SAMPLE_DATA_PATH, PUZZLE_INPUT_PATH])
+def test_solve_file_matches_solve_lines(file_path: Path, block_size: int):
+    lines = file_path.read_text().splitlines()
+    assert main.solve_file(file_path, block_size=block_size) == main.solve_lines(
+        lines
+    )
+
+
+def test_solve_bytes_without_trailing_newline():
+    assert main.solve_bytes(b"A Y\nB X\nC Z") == (15, 12)
+    assert main.solve_bytes(b"") == (0, 0)
+
+
+def test_solve_bytes_with_crlf_line_endings():
+    assert main.solve_bytes(b"A Y\r\nB X\r\nC Z\r\n") == (15, 12)
+    assert main.solve_bytes(b"A Y\r\nB X\r\nC Z") == (15, 12)
+
+
+def test_main_with_crlf_line_endings(tmp_path: Path):
+    file_path = tmp_path / "crlf.txt"
+    file_path.write_bytes(SAMPLE_DATA_PATH.read_bytes().replace(b"\n", b"\r\n"))
+    assert main.main(file_path) == main.main(SAMPLE_DATA_PATH)
+    assert main.solve_file(file_path, block_size=7) == (15, 12)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"A Y\nB X\n\n", b"A YB X\n\n", b"A W\n", b"A Y\r\nB X\n", b"A Y\r\r\nB X\r\r\n"],
+)
+def test_solve_bytes_with_invalid_guide(data: bytes):
+    with pytest.raises(ValueError):
+        main.solve_bytes(data)
+
+
+@pytest.mark.parametrize("file_path", [SAMPLE_DATA_PATH, PUZZLE_INPUT_PATH])
+def test_tournament_matches_enum_model(file_path: Path):
+    lines = file_path.read_text().splitlines()
+    assert main.Tournament().solve_lines(lines) == (
+        sum(main.resolve_match(line) for line in lines),
+        sum(main.resolve_match_from_result(line) for line in lines),
+    )
+
+
+@pytest.mark.parametrize(
+    "opponent,own,result",
+    [
+        # Rock, paper, scissors, Spock and lizard
+        (0, 2, main.Results.LOSS),
+        (0, 3, main.Results.WIN),
+        (3, 4, main.Results.WIN),
+        (4, 1, main.Results.LOSS),
+        (4, 0, main.Results.WIN),
+        (2, 2, main.Results.TIE),
+    ],
+)
+def test_tournament_with_five_shapes(opponent: int, own: int, result):
+    tournament = main.Tournament(opponent_symbols="ABCDE", own_symbols="VWXYZ")
+    assert tournament.result(opponent=opponent, own=own) == result
+    assert tournament.result(opponent=own, own=opponent) == {
+        main.Results.WIN: main.Results.LOSS,
+        main.Results.LOSS: main.Results.WIN,
+        main.Results.TIE: main.Results.TIE,
+    }[result]
+
+
+@pytest.mark.parametrize(
+    "wanted_result,result,offset",
+    [
+        ("X", main.Results.LOSS, -1),
+        ("Y", main.Results.TIE, 0),
+        ("Z", main.Results.WIN, 1),
+    ],
+)
+@pytest.mark.parametrize("shape_count", [3, 5, 7])
+def test_tournament_chooses_shape_for_result(
+    shape_count: int, wanted_result: str, result, offset: int
+):
+    symbols = "ABCDEFG"[:shape_count]
+    tournament = main.Tournament(opponent_symbols=symbols, own_symbols=symbols)
+    for opponent_idx, opponent in enumerate(symbols):
+        chosen = tournament.choose_shape(opponent_idx, wanted_result)
+        assert chosen == (opponent_idx + offset) % shape_count
+        assert tournament.result(opponent=opponent_idx, own=chosen) is result
+        assert tournament.resolve_match_from_result(f"{opponent} {wanted_result}") == (
+            chosen + 1 + result.value.score
+        )
+
+
+@pytest.mark.parametrize(
+    "opponent_symbols,own_symbols", [("AB", "XY"), ("ABCD", "WXYZ"), ("ABC", "XY")]
+)
+def test_tournament_with_invalid_symbols(opponent_symbols: str, own_symbols: str):
+    with pytest.raises(ValueError):
+        main.Tournament(opponent_symbols=opponent_symbols, own_symbols=own_symbols)
+
+
+@pytest.mark.parametrize("file_path", [SAMPLE_DATA_PATH, PUZZLE_INPUT_PATH])
+def test_vectorized_matches_main(file_path: Path):
+    pytest.importorskip("numpy")
+    import vectorized
+
+    text = file_path.read_text()
+    answers = (main.first_part(text), main.second_part(text))
+    assert vectorized.solve_file(file_path, block_size=12) == answers
+    assert vectorized.solve_text(text.rstrip("\n")) == answers
+
+
+@pytest.mark.parametrize("text", ["A Y\nB X\n\n", "A YB X\n", "A W\n", "@ X\n"])
+def test_vectorized_with_invalid_guide(text: str):
+    pytest.importorskip("numpy")
+    import vectorized
+
+    with pytest.raises(ValueError):
+        vectorized.solve_text(text)
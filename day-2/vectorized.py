@@ -0,0 +1,88 @@
+"""
+NumPy backend that scores whole strategy guides with array arithmetic.
+
+Every round is a fixed four byte record such as ``A X\n``, so the guide is
+viewed as an (N, 4) uint8 array and both parts are scored modulo three.
+Files are scored a block of records at a time to bound memory use.
+"""
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+RECORD_SIZE = 4
+OPPONENT_BASE = ord("A")
+OWN_BASE = ord("X")
+SPACE = ord(" ")
+NEWLINE = ord("\n")
+
+
+def parse_records(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse the uint8 data to the opponent and own code indexes of each round.
+
+    The indexes are zero to two: rock, paper and scissors for the opponent and
+    either the shape or the loss, tie and win wanted by the second part.
+    """
+    if len(data) % RECORD_SIZE == RECORD_SIZE - 1:
+        data = np.append(data, np.uint8(NEWLINE))
+    if len(data) % RECORD_SIZE != 0:
+        raise ValueError(f"Expected every line to be {RECORD_SIZE} bytes.")
+    records = data.reshape(-1, RECORD_SIZE)
+    opponent = records[:, 0] - np.uint8(OPPONENT_BASE)
+    own = records[:, 2] - np.uint8(OWN_BASE)
+    # Bytes below the bases wrap around to large indexes
+    if (
+        np.any(records[:, 1] != SPACE)
+        or np.any(records[:, 3] != NEWLINE)
+        or np.any(opponent > 2)
+        or np.any(own > 2)
+    ):
+        raise ValueError("Expected every line to be like 'A X'.")
+    return opponent, own
+
+
+def score_records(opponent: np.ndarray, own: np.ndarray) -> Tuple[int, int]:
+    """
+    Score both parts from the code indexes of each round.
+
+    The own shape wins when it is one step ahead of the opponent modulo
+    three, so the result is the step count plus one modulo three.
+    """
+    # Three is added before subtracting to stay within unsigned integers
+    part_1_results = (own + np.uint8(4) - opponent) % np.uint8(3)
+    part_1_score = (own + np.uint8(1) + np.uint8(3) * part_1_results).sum(
+        dtype=np.int64
+    )
+    part_2_shapes = (opponent + own + np.uint8(2)) % np.uint8(3)
+    part_2_score = (part_2_shapes + np.uint8(1) + np.uint8(3) * own).sum(
+        dtype=np.int64
+    )
+    return int(part_1_score), int(part_2_score)
+
+
+def solve_data(data: np.ndarray) -> Tuple[int, int]:
+    return score_records(*parse_records(data))
+
+
+def solve_text(text: str) -> Tuple[int, int]:
+    """
+    Solve both parts like first_part and second_part of main.
+    """
+    return solve_data(np.frombuffer(text.encode(), dtype=np.uint8))
+
+
+def solve_file(file_path: Path, block_size: int = 2**24) -> Tuple[int, int]:
+    """
+    Solve both parts reading a block of whole records at a time.
+    """
+    block_size -= block_size % RECORD_SIZE
+    part_1_total_score, part_2_total_score = 0, 0
+    with file_path.open("rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            part_1_score, part_2_score = solve_data(
+                np.frombuffer(block, dtype=np.uint8)
+            )
+            part_1_total_score += part_1_score
+            part_2_total_score += part_2_score
+    return part_1_total_score, part_2_total_score
@@ -0,0 +1,47 @@
+"""
+Generate rucksack manifests of any size.
+"""
+import random
+import string
+from typing import Iterator, List
+
+SEED = 2022
+
+
+def generate_group(rng: random.Random) -> List[str]:
+    """
+    Generate three rucksacks that share exactly one badge.
+
+    Apart from the badge, each rucksack draws from its own pool of letters
+    so that no other letter is common to the whole group. Each pool has one
+    letter that goes in both compartments and the rest are split between
+    the left and the right compartment.
+    """
+    badge = rng.choice(string.ascii_letters)
+    others = [letter for letter in string.ascii_letters if letter != badge]
+    rng.shuffle(others)
+
+    group = []
+    for pool_idx in range(3):
+        pool = others[pool_idx * 17 : (pool_idx + 1) * 17]
+        shared, left_only, right_only = pool[0], pool[1:9], pool[9:]
+        compartment_length = rng.randint(4, 16)
+
+        left = [shared] + rng.choices(left_only, k=compartment_length - 1)
+        right = [shared] + rng.choices(right_only, k=compartment_length - 1)
+        badge_compartment = rng.choice((left, right))
+        badge_compartment[-1] = badge
+        rng.shuffle(left)
+        rng.shuffle(right)
+        group.append("".join(left + right))
+    return group
+
+
+def generate_input(size: int, seed: int = SEED) -> Iterator[str]:
+    """
+    Yield a manifest of size rucksacks, rounded up to whole groups of three.
+    """
+    rng = random.Random(seed)
+    for _ in range(0, size, 3):
+        for line in generate_group(rng):
+            yield f"{line}\n"
@@ -1,15 +1,19 @@
 """
 Main script.
 """
+import mmap
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from textwrap import dedent
 from enum import Enum, unique
 from dataclasses import dataclass
-from typing import NamedTuple, Set, Tuple, List
+from typing import Iterable, Iterator, NamedTuple, Optional, Set, Tuple, List, Union
 from functools import total_ordering, reduce
 import logging
 import string
 from itertools import accumulate
+from operator import and_
 
 from pathlib import Path
 
@@ -31,57 +35,93 @@ def calculate_priority(token: str) -> int:
     raise ValueError(f"Expected token {token} to be a lower or uppercase letter.")
 
 
-def parse_compartment_contents(line: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
-    all_letters = tuple(line)
-    all_letters_length = len(all_letters)
-    assert all_letters_length == len(line)
+# Set for bytes that are not items so that invalid items survive bitwise OR
+INVALID_ITEM_BIT = 1 << 52
 
-    split_index = all_letters_length // 2
-    first_compartment = all_letters[0:split_index]
-    second_compartment = all_letters[split_index:]
-    assert len(first_compartment) == len(second_compartment)
-    return first_compartment, second_compartment
+# Bit of each byte value, the bit index being one less than the priority
+ITEM_BITS: Tuple[int, ...] = tuple(
+    1 << (calculate_priority(chr(byte)) - 1)
+    if chr(byte) in string.ascii_letters
+    else INVALID_ITEM_BIT
+    for byte in range(256)
+)
 
 
-def appears_in_both(
-    first_compartment: Tuple[str, ...], second_compartment: Tuple[str, ...]
-) -> str:
-    intersecting = set(first_compartment).intersection(set(second_compartment))
-    assert len(intersecting) == 1
-    value = intersecting.pop()
-    return value
+def item_mask(items: bytes) -> int:
+    """
+    Encode items as a 52-bit mask with a bit set for each item type.
+    """
+    mask = 0
+    for item in items:
+        mask |= ITEM_BITS[item]
+    if mask & INVALID_ITEM_BIT:
+        raise ValueError(f"Expected items {items!r} to be lower or uppercase letters.")
+    return mask
+
+
+def mask_priority(mask: int) -> int:
+    """
+    Calculate priority of the single item type in a mask.
+    """
+    if mask == 0 or mask & (mask - 1) != 0:
+        raise ValueError(f"Expected exactly one common item in mask {mask:b}.")
+    return mask.bit_length()
+
+
+def compartment_masks(items: bytes) -> Tuple[int, int]:
+    """
+    Encode the items of both compartments of a rucksack as masks.
+    """
+    split_index = len(items) // 2
+    if len(items) % 2 != 0:
+        raise ValueError(f"Expected items {items!r} to split into equal compartments.")
+    return item_mask(items[:split_index]), item_mask(items[split_index:])
 
 
 def line_priority(line: str) -> int:
-    first_compartment, second_compartment = parse_compartment_contents(line=line)
-    token_that_appears_in_both = appears_in_both(first_compartment, second_compartment)
-    priority = calculate_priority(token=token_that_appears_in_both)
-    return priority
+    first_compartment, second_compartment = compartment_masks(line.encode())
+    return mask_priority(first_compartment & second_compartment)
 
 
-def first_part(text: str):
+def parse_model(text: str) -> List[str]:
+    """
+    Parse text into the rucksack lines shared by both parts.
+    """
     assert len(text) > 0
 
-    return sum([line_priority(line) for line in text.splitlines()])
+    return text.splitlines()
 
 
-def parse_groups(text: str) -> List[List[str]]:
-    lines = text.splitlines()
+def first_part_from_model(lines: List[str]) -> int:
+    """
+    Solve first part from parsed rucksack lines.
+    """
+    return sum([line_priority(line) for line in lines])
+
+
+def first_part(text: str):
+    return first_part_from_model(parse_model(text=text))
+
+
+def group_lines(lines: List[str]) -> List[List[str]]:
     groups = [lines[start : start + 3] for start in range(0, len(lines), 3)]
     return groups
 
 
+def parse_groups(text: str) -> List[List[str]]:
+    return group_lines(text.splitlines())
+
+
 def group_priority(group: List[str]) -> int:
     assert len(group) == 3
-    logging.info(f"Resolving badge for group with backbacks as such: {group}")
-    result = reduce(set.intersection, map(set, group))
-    logging.info(f"Badge is {result}")
-    assert len(result) == 1
-    return calculate_priority(result.pop())
+    return mask_priority(reduce(and_, [item_mask(line.encode()) for line in group]))
 
 
-def second_part(text: str):
-    groups = parse_groups(text)
+def second_part_from_model(lines: List[str]) -> int:
+    """
+    Solve second part from parsed rucksack lines.
+    """
+    groups = group_lines(lines)
     logging.info(f"Found {len(groups)} from read text.")
     result = sum([group_priority(group) for group in groups])
     logging.info(f"Sum of priorities is {result}")
@@ -89,6 +129,145 @@ def second_part(text: str):
     return result
 
 
+def second_part(text: str):
+    return second_part_from_model(parse_model(text=text))
+
+
+GROUP_SIZE = 3
+ALL_ITEMS_MASK = INVALID_ITEM_BIT - 1
+
+
+def solve_lines(lines: Iterable[Union[str, bytes]]) -> Tuple[int, int]:
+    """
+    Solve both parts in a single pass over the rucksack lines.
+
+    Each line is read once and only the intersection of the rucksacks of the
+    current group is kept, so memory use does not grow with the input.
+    """
+    part_1_sum, part_2_sum = 0, 0
+    group_mask, group_size = ALL_ITEMS_MASK, 0
+    for line in lines:
+        items = (line.encode() if isinstance(line, str) else line).rstrip(b"\r\n")
+        first_compartment, second_compartment = compartment_masks(items)
+        part_1_sum += mask_priority(first_compartment & second_compartment)
+        group_mask &= first_compartment | second_compartment
+        group_size += 1
+        if group_size == GROUP_SIZE:
+            part_2_sum += mask_priority(group_mask)
+            group_mask, group_size = ALL_ITEMS_MASK, 0
+    if group_size != 0:
+        raise ValueError(f"Expected rucksacks to be in groups of {GROUP_SIZE}.")
+    return part_1_sum, part_2_sum
+
+
+def solve_file(file_path: Path) -> Tuple[int, int]:
+    """
+    Solve both parts streaming the lines of a file.
+    """
+    with file_path.open("rb") as handle:
+        return solve_lines(handle)
+
+
+def count_newlines(
+    mapped: Union[mmap.mmap, bytes], start: int, end: int, block_size: int = 2**24
+) -> int:
+    """
+    Count the newlines between start and end copying a block at a time.
+    """
+    return sum(
+        mapped[block_start : min(block_start + block_size, end)].count(b"\n")
+        for block_start in range(start, end, block_size)
+    )
+
+
+def group_aligned_ranges(
+    mapped: Union[mmap.mmap, bytes], range_count: int
+) -> List[Tuple[int, int]]:
+    """
+    Split into at most range_count byte ranges that each start at a group.
+
+    Each split point is moved forward to the start of the next line and then
+    by as many lines as are needed for the range to hold whole groups.
+    """
+    size = len(mapped)
+    starts = [0]
+    for idx in range(1, range_count):
+        target = max(size * idx // range_count, starts[-1])
+        boundary = mapped.find(b"\n", target) + 1
+        if boundary == 0:
+            break
+        missing_lines = -count_newlines(mapped, starts[-1], boundary) % GROUP_SIZE
+        for _ in range(missing_lines):
+            boundary = mapped.find(b"\n", boundary) + 1
+            if boundary == 0:
+                break
+        if boundary == 0 or boundary >= size:
+            break
+        if boundary > starts[-1]:
+            starts.append(boundary)
+    ends = [*starts[1:], size]
+    return [(start, end) for start, end in zip(starts, ends) if start < end]
+
+
+def iter_range_lines(
+    mapped: Union[mmap.mmap, bytes], start: int, end: int, block_size: int = 2**20
+) -> Iterator[bytes]:
+    """
+    Yield the lines between start and end a block of whole lines at a time.
+
+    Copy of iter_range_lines of day 1, as each day runs as a standalone
+    script. Changes to either should be made to both.
+    """
+    while start < end:
+        block_end = min(start + block_size, end)
+        if block_end < end:
+            newline = mapped.rfind(b"\n", start, block_end)
+            if newline == -1:
+                # Line longer than a block
+                newline = mapped.find(b"\n", block_end, end)
+            block_end = end if newline == -1 else newline + 1
+        yield from mapped[start:block_end].splitlines()
+        start = block_end
+
+
+def solve_range(file_path: Path, start: int, end: int) -> Tuple[int, int]:
+    """
+    Solve both parts for the groups in a byte range of a file.
+    """
+    with file_path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return solve_lines(iter_range_lines(mapped, start, end))
+
+
+def parallel_solve_file(
+    file_path: Path, workers: Optional[int] = None, range_count: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Solve both parts by solving ranges of whole groups in worker processes.
+
+    The priority sums of the ranges add up to the sums of the whole file as
+    no group is split between ranges. By default there is a range per worker.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    range_count = workers if range_count is None else range_count
+    if file_path.stat().st_size == 0:
+        return 0, 0
+    with file_path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            ranges = group_aligned_ranges(mapped, range_count=range_count)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        range_sums = list(
+            executor.map(
+                solve_range, *zip(*[(file_path, start, end) for start, end in ranges])
+            )
+        )
+    return (
+        sum(part_1_sum for part_1_sum, _ in range_sums),
+        sum(part_2_sum for _, part_2_sum in range_sums),
+    )
+
+
 def test_first_part_with_sample_data():
     assert first_part(SAMPLE_DATA_PATH.read_text()) == 157
 
@@ -97,17 +276,57 @@ def test_second_part_with_sample_data():
     assert second_part(SAMPLE_DATA_PATH.read_text()) == 70
 
 
+def test_item_mask_priorities():
+    for token in string.ascii_letters:
+        assert mask_priority(item_mask(token.encode())) == calculate_priority(token)
+
+
+def test_solve_file_with_sample_data():
+    assert solve_file(SAMPLE_DATA_PATH) == (157, 70)
+
+
+def test_group_aligned_ranges():
+    data = (Path(__file__).parent / "puzzle_input.txt").read_bytes()
+    for range_count in (1, 2, 7, 1000):
+        ranges = group_aligned_ranges(data, range_count=range_count)
+        assert 1 <= len(ranges) <= range_count
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+            assert end == next_start
+            assert data[start:end].count(b"\n") % GROUP_SIZE == 0
+
+
+def test_iter_range_lines():
+    data = b"ab\ncd\n\nef\ngh"
+    for block_size in (1, 4, 7, 2**20):
+        lines = list(iter_range_lines(data, 0, len(data), block_size))
+        assert lines == [b"ab", b"cd", b"", b"ef", b"gh"]
+        assert list(iter_range_lines(data, 7, 10, block_size)) == [b"ef"]
+
+
+def test_parallel_solve_file_with_sample_data():
+    for range_count in (1, 2, 5):
+        assert parallel_solve_file(
+            SAMPLE_DATA_PATH, workers=2, range_count=range_count
+        ) == (157, 70)
+
+
 if __name__ == "__main__":
     file_path_arg = sys.argv[1]
     if len(file_path_arg) == 0:
         raise ValueError("Expected a filepath to be passed as argument.")
     file_path = Path(file_path_arg)
-    text = file_path.read_text()
-
-    first_part_answer = first_part(text=text)
+    # Optional second argument solves the file in that many worker processes
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    if workers is None:
+        # Lines are streamed from the file as the manifest may not fit in memory
+        first_part_answer, second_part_answer = solve_file(file_path)
+    else:
+        first_part_answer, second_part_answer = parallel_solve_file(
+            file_path, workers=workers
+        )
 
     print(f"Answer to first part: {first_part_answer}")
 
-    second_part_answer = second_part(text=text)
-
     print(f"Answer to second part: {second_part_answer}")
@@ -0,0 +1,24 @@
+"""
+Generate section assignment lists of any size.
+"""
+import random
+from typing import Iterator
+
+SEED = 2022
+MAX_SECTION = 99
+
+
+def generate_input(
+    size: int, seed: int = SEED, max_section: int = MAX_SECTION
+) -> Iterator[str]:
+    """
+    Yield size assignment pairs line by line.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        bounds = []
+        for _ in range(2):
+            start = rng.randint(1, max_section)
+            end = rng.randint(start, max_section)
+            bounds.append(f"{start}-{end}")
+        yield f"{','.join(bounds)}\n"
@@ -2,10 +2,12 @@
 Main script.
 """
 import sys
+from array import array
+from bisect import bisect_left, bisect_right
 from textwrap import dedent
 from enum import Enum, unique
 from dataclasses import dataclass
-from typing import NamedTuple, Set, Tuple, List
+from typing import Iterable, Iterator, NamedTuple, Optional, Set, Tuple, List
 from functools import total_ordering, reduce
 import logging
 import string
@@ -50,46 +52,361 @@ def parse_line(line: str) -> Tuple[Assignment, Assignment]:
     )
 
 
-def first_part(text: str) -> int:
+def parse_model(text: str) -> List[Tuple[Assignment, Assignment]]:
     """
-    Solve first part.
+    Parse text into the assignment pairs shared by both parts.
     """
-    assignment_pairs = [parse_line(line) for line in text.splitlines()]
+    return [parse_line(line) for line in text.splitlines()]
+
 
+def first_part_from_model(
+    assignment_pairs: List[Tuple[Assignment, Assignment]]
+) -> int:
+    """
+    Solve first part from parsed assignment pairs.
+    """
     either_contains_other = [
         Assignment.either_contains(first, second) for first, second in assignment_pairs
     ]
     return sum(either_contains_other)
 
 
-def second_part(text: str) -> int:
+def first_part(text: str) -> int:
     """
-    Solve second part.
+    Solve first part.
     """
-    assignment_pairs = [parse_line(line) for line in text.splitlines()]
-    logging.info(f"All pairs: {assignment_pairs}")
+    return first_part_from_model(parse_model(text=text))
 
+
+def second_part_from_model(
+    assignment_pairs: List[Tuple[Assignment, Assignment]]
+) -> int:
+    """
+    Solve second part from parsed assignment pairs.
+    """
     intersecting = [
         Assignment.either_intersects(first, second)
         for first, second in assignment_pairs
     ]
-    logging.info(
-        f"Intersecting pairs: {list(compress(assignment_pairs, intersecting))}"
-    )
+    # The pairs are only formatted when the messages would be emitted
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("All pairs: %s", assignment_pairs)
+        logging.info(
+            "Intersecting pairs: %s", list(compress(assignment_pairs, intersecting))
+        )
     return sum(intersecting)
 
 
+def second_part(text: str) -> int:
+    """
+    Solve second part.
+    """
+    return second_part_from_model(parse_model(text=text))
+
+
+# What is left of a line like 2-4,6-8 once its digits are deleted
+LINE_SEPARATORS = b"-,-\n"
+DIGITS = b"0123456789"
+SEPARATORS_TO_SPACES = bytes.maketrans(b"-,", b"  ")
+
+
+def iter_bounds(blocks: Iterable[bytes]) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Yield the four section bounds of each line in blocks of whole lines.
+
+    Each block is checked and split into numbers by a few bytes operations
+    instead of splitting each line, and no Assignment is built. Lines may end
+    in LF or CRLF.
+    """
+    for block in blocks:
+        if b"\r" in block:
+            # CRLF line endings are read as is from files opened in binary mode
+            block = block.replace(b"\r\n", b"\n")
+        if not block.endswith(b"\n"):
+            block += b"\n"
+        line_count = block.count(b"\n")
+        numbers = block.translate(SEPARATORS_TO_SPACES).split()
+        if (
+            block.translate(None, DIGITS) != LINE_SEPARATORS * line_count
+            or len(numbers) != len(LINE_SEPARATORS) * line_count
+        ):
+            raise ValueError("Expected every line to be like '2-4,6-8'.")
+        values = map(int, numbers)
+        yield from zip(values, values, values, values)
+
+
+def solve_blocks(blocks: Iterable[bytes]) -> Tuple[int, int]:
+    """
+    Solve both parts in a single pass over blocks of whole lines.
+    """
+    contained_count, intersecting_count = 0, 0
+    for first_start, first_end, second_start, second_end in iter_bounds(blocks):
+        if (first_start <= second_start and first_end >= second_end) or (
+            second_start <= first_start and second_end >= first_end
+        ):
+            contained_count += 1
+        if first_start <= second_end and second_start <= first_end:
+            intersecting_count += 1
+    return contained_count, intersecting_count
+
+
+def solve_lines(lines: Iterable[str]) -> Tuple[int, int]:
+    """
+    Solve both parts in a single pass over the assignment pair lines.
+    """
+    return solve_blocks(line.encode() for line in lines)
+
+
+def iter_blocks(file_path: Path, block_size: int = 2**20) -> Iterator[bytes]:
+    """
+    Yield the file a block of whole lines at a time.
+    """
+    with file_path.open("rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            # Complete the last line of the block
+            yield block + handle.readline()
+
+
+def solve_file(file_path: Path) -> Tuple[int, int]:
+    return solve_blocks(iter_blocks(file_path))
+
+
+class IndexedAssignment(NamedTuple):
+    assignment: Assignment
+    pair_idx: int
+
+
+class IntervalNode(NamedTuple):
+    """
+    Node of a centered interval tree.
+
+    The node holds the assignments that cover its center, sorted by start and
+    by end, and the subtrees hold the ones wholly before and after it.
+    """
+
+    center: int
+    by_start: List[IndexedAssignment]
+    by_end: List[IndexedAssignment]
+    before: Optional["IntervalNode"]
+    after: Optional["IntervalNode"]
+
+
+def build_interval_tree(
+    assignments: List[IndexedAssignment],
+) -> Optional[IntervalNode]:
+    """
+    Build a centered interval tree from assignments sorted by start.
+
+    The center of each node is the start of its median assignment, so that
+    no node is empty and both subtrees hold at most half of the assignments.
+    """
+    if len(assignments) == 0:
+        return None
+    center = assignments[len(assignments) // 2].assignment.start
+    before = [item for item in assignments if item.assignment.end < center]
+    after = [item for item in assignments if item.assignment.start > center]
+    covering = [
+        item
+        for item in assignments
+        if item.assignment.start <= center <= item.assignment.end
+    ]
+    return IntervalNode(
+        center=center,
+        by_start=covering,
+        by_end=sorted(covering, key=lambda item: item.assignment.end, reverse=True),
+        before=build_interval_tree(before),
+        after=build_interval_tree(after),
+    )
+
+
+@dataclass
+class AssignmentIndex:
+    """
+    Index the assignments of all pairs for queries across elves.
+
+    Sorted starts and ends answer coverage of a section with two binary
+    searches, a sweep over them finds the most covered section once, and an
+    interval tree reports the pairs overlapping a window in O(log n + k).
+    """
+
+    pairs: List[Tuple[Assignment, Assignment]]
+    starts: List[int]
+    ends: List[int]
+    max_coverage: int
+    max_coverage_section: Optional[int]
+    tree: Optional[IntervalNode]
+
+    @classmethod
+    def from_pairs(
+        cls, assignment_pairs: List[Tuple[Assignment, Assignment]]
+    ) -> "AssignmentIndex":
+        assignments = sorted(
+            (
+                IndexedAssignment(assignment=assignment, pair_idx=pair_idx)
+                for pair_idx, pair in enumerate(assignment_pairs)
+                for assignment in pair
+            ),
+            key=lambda item: item.assignment.start,
+        )
+        for item in assignments:
+            if item.assignment.start > item.assignment.end:
+                raise ValueError(f"Expected {item.assignment} to end after start.")
+        starts = [item.assignment.start for item in assignments]
+        ends = sorted(item.assignment.end for item in assignments)
+
+        # Sweep over the starts and the sections after the ends in order
+        max_coverage, max_coverage_section = 0, None
+        coverage, end_idx = 0, 0
+        for start in starts:
+            while ends[end_idx] < start:
+                coverage -= 1
+                end_idx += 1
+            coverage += 1
+            if coverage > max_coverage:
+                max_coverage, max_coverage_section = coverage, start
+
+        return cls(
+            pairs=assignment_pairs,
+            starts=starts,
+            ends=ends,
+            max_coverage=max_coverage,
+            max_coverage_section=max_coverage_section,
+            tree=build_interval_tree(assignments),
+        )
+
+    def coverage(self, section: int) -> int:
+        """
+        Count the assignments that cover a section.
+        """
+        return bisect_right(self.starts, section) - bisect_left(self.ends, section)
+
+    def overlapping_pairs(self, start: int, end: int) -> List[int]:
+        """
+        Find the indexes of pairs with an assignment overlapping a window.
+        """
+        pair_idxs: Set[int] = set()
+        nodes = [self.tree]
+        while nodes:
+            node = nodes.pop()
+            if node is None:
+                continue
+            if end < node.center:
+                # Assignments of the node end after the window starts
+                for item in node.by_start:
+                    if item.assignment.start > end:
+                        break
+                    pair_idxs.add(item.pair_idx)
+                nodes.append(node.before)
+            elif start > node.center:
+                # Assignments of the node start before the window ends
+                for item in node.by_end:
+                    if item.assignment.end < start:
+                        break
+                    pair_idxs.add(item.pair_idx)
+                nodes.append(node.after)
+            else:
+                pair_idxs.update(item.pair_idx for item in node.by_start)
+                nodes.extend((node.before, node.after))
+        return sorted(pair_idxs)
+
+
+# Digits of a binary string from per-section coverage flags
+FLAGS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def coverage_differences(assignments: Iterable[Assignment]) -> array:
+    """
+    Build the difference array of the sections covered by assignments.
+
+    The array ends one past the last section so its prefix sums are the
+    number of assignments covering each section.
+    """
+    differences = array("q")
+    for start, end in assignments:
+        if start < 0 or start > end:
+            raise ValueError(f"Expected sections {start}-{end} to be in order.")
+        if end + 2 > len(differences):
+            missing = end + 2 - len(differences)
+            differences.frombytes(bytes(differences.itemsize * missing))
+        differences[start] += 1
+        differences[end + 1] -= 1
+    return differences
+
+
+@dataclass(frozen=True)
+class SectionCoverage:
+    """
+    Set of covered sections stored as the bits of an integer.
+
+    Bit n is set when section n is covered, so a million sections take about
+    125 KiB, and unions and intersections of groups are bitwise operations.
+    """
+
+    bits: int = 0
+
+    @classmethod
+    def from_assignments(cls, assignments: Iterable[Assignment]) -> "SectionCoverage":
+        """
+        Build the coverage of assignments with a difference array.
+
+        Each assignment adds one at its start and subtracts one after its end,
+        so building costs O(1) per assignment and O(1) per section. While
+        building, the array and the flags take about 16 bytes per section.
+        """
+        differences = coverage_differences(assignments)
+        if len(differences) == 0:
+            return cls()
+        flags = bytes(map(bool, accumulate(differences)))
+        return cls(int(flags.translate(FLAGS_TO_DIGITS)[::-1], 2))
+
+    @classmethod
+    def from_pairs(
+        cls, assignment_pairs: Iterable[Tuple[Assignment, Assignment]]
+    ) -> "SectionCoverage":
+        return cls.from_assignments(
+            assignment for pair in assignment_pairs for assignment in pair
+        )
+
+    def __or__(self, other: "SectionCoverage") -> "SectionCoverage":
+        return SectionCoverage(self.bits | other.bits)
+
+    def __and__(self, other: "SectionCoverage") -> "SectionCoverage":
+        return SectionCoverage(self.bits & other.bits)
+
+    def __contains__(self, section: int) -> bool:
+        return section >= 0 and (self.bits >> section) & 1 == 1
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def sections(self) -> Iterator[int]:
+        """
+        Yield the covered sections in order.
+        """
+        digits = bin(self.bits)[:1:-1]
+        section = digits.find("1")
+        while section != -1:
+            yield section
+            section = digits.find("1", section + 1)
+
+    def uncovered(self, start: int, end: int) -> "SectionCoverage":
+        """
+        Get the sections from start to end that are not covered.
+        """
+        if start < 0 or start > end:
+            raise ValueError(f"Expected sections {start}-{end} to be in order.")
+        window = ((1 << (end - start + 1)) - 1) << start
+        return SectionCoverage(window & ~self.bits)
+
+
 if __name__ == "__main__":
     file_path_arg = sys.argv[1]
     if len(file_path_arg) == 0:
         raise ValueError("Expected a filepath to be passed as argument.")
     file_path = Path(file_path_arg)
-    text = file_path.read_text()
-
-    first_part_answer = first_part(text=text)
+    # Lines are streamed from the file as the assignments may not fit in memory
+    first_part_answer, second_part_answer = solve_file(file_path)
 
     print(f"Answer to first part: {first_part_answer}")
 
-    second_part_answer = second_part(text=text)
-
     print(f"Answer to second part: {second_part_answer}")
@@ -1,10 +1,13 @@
+import logging
 import main
+from itertools import accumulate
 from pathlib import Path
 
 import pytest
 from main import Assignment
 
 SAMPLE_DATA_PATH = Path(__file__).parent / "sample_data.txt"
+PUZZLE_INPUT_PATH = Path(__file__).parent / "puzzle_input.txt"
 
 
 @pytest.mark.parametrize(
@@ -43,3 +46,152 @@ def test_first_part_with_sample_data():
 
 def test_second_part_with_sample_data():
     assert main.second_part(SAMPLE_DATA_PATH.read_text()) == 4
+
+
+@pytest.mark.parametrize("file_path", [SAMPLE_DATA_PATH, PUZZLE_INPUT_PATH])
+def test_vectorized_matches_main(file_path: Path):
+    pytest.importorskip("numpy")
+    import vectorized
+
+    text = file_path.read_text()
+    answers = (main.first_part(text), main.second_part(text))
+    assert vectorized.solve_file(file_path, block_size=10) == answers
+    assert vectorized.solve_text(text.rstrip("\n")) == answers
+
+
+@pytest.mark.parametrize(
+    "text", ["2-4,6-8\n\n", "2-4,6\n", "2-4-6,8\n", "2-4,-8\n", "2-4,6-a\n"]
+)
+def test_vectorized_with_invalid_pairs(text: str):
+    pytest.importorskip("numpy")
+    import vectorized
+
+    with pytest.raises(ValueError):
+        vectorized.solve_text(text)
+
+
+@pytest.fixture(scope="module")
+def puzzle_pairs():
+    return main.parse_model(PUZZLE_INPUT_PATH.read_text())
+
+
+def test_assignment_index_coverage(puzzle_pairs):
+    index = main.AssignmentIndex.from_pairs(puzzle_pairs)
+    assignments = [assignment for pair in puzzle_pairs for assignment in pair]
+    coverages = {
+        section: sum(start <= section <= end for start, end in assignments)
+        for section in range(0, 101)
+    }
+    for section, coverage in coverages.items():
+        assert index.coverage(section) == coverage
+    assert index.max_coverage == max(coverages.values())
+    assert coverages[index.max_coverage_section] == index.max_coverage
+
+
+@pytest.mark.parametrize("start,end", [(0, 0), (1, 1), (10, 20), (50, 50), (99, 200)])
+def test_assignment_index_overlapping_pairs(puzzle_pairs, start: int, end: int):
+    index = main.AssignmentIndex.from_pairs(puzzle_pairs)
+    window = Assignment(start=start, end=end)
+    assert index.overlapping_pairs(start, end) == [
+        pair_idx
+        for pair_idx, pair in enumerate(puzzle_pairs)
+        if any(assignment.either_intersects(window) for assignment in pair)
+    ]
+
+
+def test_assignment_index_with_sample_data():
+    index = main.AssignmentIndex.from_pairs(
+        main.parse_model(SAMPLE_DATA_PATH.read_text())
+    )
+    assert index.coverage(6) == 8
+    assert (index.max_coverage, index.max_coverage_section) == (8, 6)
+    assert index.overlapping_pairs(1, 1) == []
+    assert index.overlapping_pairs(9, 9) == [2]
+
+
+def test_assignment_index_without_pairs():
+    index = main.AssignmentIndex.from_pairs([])
+    assert index.coverage(1) == 0
+    assert index.max_coverage == 0
+    assert index.overlapping_pairs(1, 2) == []
+
+
+@pytest.mark.parametrize("line_ending", [b"\n", b"\r\n"])
+@pytest.mark.parametrize("file_path", [SAMPLE_DATA_PATH, PUZZLE_INPUT_PATH])
+def test_solve_file_matches_main(file_path: Path, line_ending: bytes, tmp_path: Path):
+    text = file_path.read_text()
+    answers = (main.first_part(text), main.second_part(text))
+    file_path = tmp_path / file_path.name
+    file_path.write_bytes(text.encode().replace(b"\n", line_ending))
+    assert main.solve_file(file_path) == answers
+    assert main.solve_blocks(main.iter_blocks(file_path, block_size=10)) == answers
+    assert main.solve_lines(text.splitlines()) == answers
+
+
+def test_iter_bounds():
+    blocks = [b"2-4,6-8\n12-345,6-7\n", b"1-1,1-1"]
+    assert list(main.iter_bounds(blocks)) == [
+        (2, 4, 6, 8),
+        (12, 345, 6, 7),
+        (1, 1, 1, 1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "block", [b"2-4,6-8\n\n", b"2-4,6\n", b"2,4-6-8\n", b"2-4,-8\n", b"2-4,6-a\n"]
+)
+def test_iter_bounds_with_invalid_lines(block: bytes):
+    with pytest.raises(ValueError):
+        list(main.iter_bounds([block]))
+
+
+def test_second_part_logging(caplog):
+    pairs = main.parse_model(SAMPLE_DATA_PATH.read_text())
+    with caplog.at_level(logging.INFO):
+        assert main.second_part_from_model(pairs) == 4
+    assert "Intersecting pairs" in caplog.text
+    caplog.clear()
+    assert main.second_part_from_model(pairs) == 4
+    assert caplog.text == ""
+
+
+def test_section_coverage(puzzle_pairs):
+    coverage = main.SectionCoverage.from_pairs(puzzle_pairs)
+    sections = {
+        section
+        for pair in puzzle_pairs
+        for start, end in pair
+        for section in range(start, end + 1)
+    }
+    assert len(coverage) == len(sections)
+    assert list(coverage.sections()) == sorted(sections)
+    assert all(section in coverage for section in sections)
+    assert -1 not in coverage
+    assert list(coverage.uncovered(0, 120).sections()) == sorted(
+        set(range(0, 121)) - sections
+    )
+
+
+def test_section_coverage_of_elf_groups():
+    pairs = main.parse_model(SAMPLE_DATA_PATH.read_text())
+    first_elves = main.SectionCoverage.from_assignments(first for first, _ in pairs)
+    second_elves = main.SectionCoverage.from_assignments(second for _, second in pairs)
+    assert list((first_elves & second_elves).sections()) == [3, 4, 5, 6, 7, 8]
+    assert first_elves | second_elves == main.SectionCoverage.from_pairs(pairs)
+    assert len(main.SectionCoverage()) == 0
+    assert list(main.SectionCoverage().sections()) == []
+
+
+@pytest.mark.parametrize("start,end", [(4, 2), (-1, 2)])
+def test_section_coverage_with_invalid_sections(start: int, end: int):
+    with pytest.raises(ValueError):
+        main.SectionCoverage.from_assignments([Assignment(start=start, end=end)])
+    with pytest.raises(ValueError):
+        main.SectionCoverage().uncovered(start, end)
+
+
+def test_coverage_differences_size():
+    assignments = [Assignment(start=3, end=10), Assignment(start=0, end=1000)]
+    differences = main.coverage_differences(assignments)
+    assert len(differences) == 1000 + 2
+    assert list(accumulate(differences))[:12] == [1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 1]
@@ -0,0 +1,92 @@
+"""
+NumPy backend that parses and compares all assignment pairs at once.
+
+The section bounds of every pair are parsed to a row of an (N, 4) integer
+array, and both parts are counted with vectorized comparisons of its
+columns. Files are read a block of whole lines at a time to bound memory use.
+"""
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+NEWLINE = ord("\n")
+SEPARATORS = np.frombuffer(b"-,-\n", dtype=np.uint8)
+ZERO = ord("0")
+# Larger section numbers would overflow int64
+MAX_DIGITS = 18
+
+
+def parse_bounds(data: np.ndarray) -> np.ndarray:
+    """
+    Parse the uint8 data of lines like ``2-4,6-8`` to an (N, 4) array.
+
+    The numbers end at the separators, so the digits of all numbers are
+    gathered one place at a time, counting back from the separators.
+    """
+    if len(data) == 0:
+        return np.zeros((0, 4), dtype=np.int64)
+    if data[-1] != NEWLINE:
+        data = np.append(data, np.uint8(NEWLINE))
+    is_separator = np.isin(data, SEPARATORS)
+    if np.any(~is_separator & ((data < ZERO) | (data > ZERO + 9))):
+        raise ValueError("Expected lines to only contain digits and separators.")
+
+    separator_positions = np.flatnonzero(is_separator)
+    if len(separator_positions) % len(SEPARATORS) != 0 or np.any(
+        data[separator_positions].reshape(-1, len(SEPARATORS)) != SEPARATORS
+    ):
+        raise ValueError("Expected every line to be like '2-4,6-8'.")
+    number_starts = np.concatenate(([0], separator_positions[:-1] + 1))
+    number_lengths = separator_positions - number_starts
+    if number_lengths.min() == 0 or number_lengths.max() > MAX_DIGITS:
+        raise ValueError(f"Expected section numbers of 1 to {MAX_DIGITS} digits.")
+
+    digits = data - np.uint8(ZERO)
+    values = np.zeros(len(separator_positions), dtype=np.int64)
+    for place in range(number_lengths.max()):
+        place_digits = digits.take(separator_positions - 1 - place)
+        # Numbers too short for the place would take digits of the one before
+        place_digits[number_lengths <= place] = 0
+        values += place_digits.astype(np.int64) * 10**place
+    return values.reshape(-1, 4)
+
+
+def count_pairs(bounds: np.ndarray) -> Tuple[int, int]:
+    """
+    Count the pairs in which either contains the other and that overlap.
+    """
+    first_start, first_end, second_start, second_end = bounds.T
+    contained = (
+        (first_start <= second_start) & (first_end >= second_end)
+    ) | ((second_start <= first_start) & (second_end >= first_end))
+    intersecting = (first_start <= second_end) & (second_start <= first_end)
+    return int(contained.sum()), int(intersecting.sum())
+
+
+def solve_data(data: np.ndarray) -> Tuple[int, int]:
+    return count_pairs(parse_bounds(data))
+
+
+def solve_text(text: str) -> Tuple[int, int]:
+    """
+    Solve both parts like first_part and second_part of main.
+    """
+    return solve_data(np.frombuffer(text.encode(), dtype=np.uint8))
+
+
+def solve_file(file_path: Path, block_size: int = 2**24) -> Tuple[int, int]:
+    """
+    Solve both parts reading a block of whole lines at a time.
+    """
+    contained_count, intersecting_count = 0, 0
+    with file_path.open("rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            # Complete the last line of the block
+            block += handle.readline()
+            block_contained, block_intersecting = solve_data(
+                np.frombuffer(block, dtype=np.uint8)
+            )
+            contained_count += block_contained
+            intersecting_count += block_intersecting
+    return contained_count, intersecting_count
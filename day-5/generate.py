@@ -0,0 +1,46 @@
+"""
+Generate crate stacks and rearrangement procedures of any size.
+"""
+import random
+import string
+from typing import Iterator
+
+SEED = 2022
+STACK_COUNT = 9
+MAX_STARTING_HEIGHT = 8
+
+
+def generate_input(size: int, seed: int = SEED) -> Iterator[str]:
+    """
+    Yield the starting stacks and size move instructions line by line.
+
+    Stack heights are tracked so that no move takes more crates than there
+    are and no stack is left empty.
+    """
+    rng = random.Random(seed)
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(height)]
+        for height in (
+            rng.randint(1, MAX_STARTING_HEIGHT) for _ in range(STACK_COUNT)
+        )
+    ]
+
+    for level in reversed(range(max(len(stack) for stack in stacks))):
+        marked_crates = [
+            f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+        ]
+        yield f"{' '.join(marked_crates)}\n"
+    yield f" {'   '.join(str(key) for key in range(1, STACK_COUNT + 1))} \n"
+    yield "\n"
+
+    heights = [len(stack) for stack in stacks]
+    for _ in range(size):
+        sources = [idx for idx, height in enumerate(heights) if height > 1]
+        if not sources:
+            sources = list(range(STACK_COUNT))
+        source = rng.choice(sources)
+        destination = rng.choice([idx for idx in range(STACK_COUNT) if idx != source])
+        move_count = rng.randint(1, max(heights[source] - 1, 1))
+        heights[source] -= move_count
+        heights[destination] += move_count
+        yield f"move {move_count} from {source + 1} to {destination + 1}\n"
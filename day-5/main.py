@@ -104,14 +104,30 @@ def topmost_crate_ids(crates_dict: Dict[int, List[str]]) -> str:
     return "".join(ids)
 
 
-def first_part(text: str) -> str:
+def copy_crates_dict(crates_dict: Dict[int, List[str]]) -> Dict[int, List[str]]:
     """
-    Solve first part.
+    Copy the stacks so that applying instructions leaves the original intact.
+    """
+    return {key: stack.copy() for key, stack in crates_dict.items()}
+
+
+def parse_model(text: str) -> Tuple[Dict[int, List[str]], List[Instruction]]:
+    """
+    Parse text into the crates and instructions shared by both parts.
     """
-    crates_dict, instructions = parse_input(text=text)
+    return parse_input(text=text)
+
+
+def first_part_from_model(
+    model: Tuple[Dict[int, List[str]], List[Instruction]]
+) -> str:
+    """
+    Solve first part from parsed crates and instructions.
+    """
+    crates_dict, instructions = model
 
     crates_dict_applied = apply_instructions_one_crate_at_a_time(
-        crates_dict=crates_dict.copy(), instructions=instructions
+        crates_dict=copy_crates_dict(crates_dict), instructions=instructions
     )
 
     topmost = topmost_crate_ids(crates_dict=crates_dict_applied)
@@ -120,14 +136,23 @@ def first_part(text: str) -> str:
     return topmost
 
 
-def second_part(text: str) -> str:
+def first_part(text: str) -> str:
     """
-    Solve second part.
+    Solve first part.
+    """
+    return first_part_from_model(parse_model(text=text))
+
+
+def second_part_from_model(
+    model: Tuple[Dict[int, List[str]], List[Instruction]]
+) -> str:
+    """
+    Solve second part from parsed crates and instructions.
     """
-    crates_dict, instructions = parse_input(text=text)
+    crates_dict, instructions = model
 
     crates_dict_applied = apply_instructions_multiple_crates_at_a_time(
-        crates_dict=crates_dict.copy(), instructions=instructions
+        crates_dict=copy_crates_dict(crates_dict), instructions=instructions
     )
 
     topmost = topmost_crate_ids(crates_dict=crates_dict_applied)
@@ -136,17 +161,25 @@ def second_part(text: str) -> str:
     return topmost
 
 
+def second_part(text: str) -> str:
+    """
+    Solve second part.
+    """
+    return second_part_from_model(parse_model(text=text))
+
+
 if __name__ == "__main__":
     file_path_arg = sys.argv[1]
     if len(file_path_arg) == 0:
         raise ValueError("Expected a filepath to be passed as argument.")
     file_path = Path(file_path_arg)
     text = file_path.read_text()
+    model = parse_model(text=text)
 
-    first_part_answer = first_part(text=text)
+    first_part_answer = first_part_from_model(model)
 
     print(f"Answer to first part: {first_part_answer}")
 
-    second_part_answer = second_part(text=text)
+    second_part_answer = second_part_from_model(model)
 
     print(f"Answer to second part: {second_part_answer}")
@@ -54,3 +54,9 @@ def test_first_part_with_sample_data():
 
 def test_second_part_with_sample_data():
     assert main.second_part(SAMPLE_DATA_PATH.read_text()) == "MCD"
+
+
+def test_both_parts_from_shared_model():
+    model = main.parse_model(SAMPLE_DATA_PATH.read_text())
+    assert main.first_part_from_model(model) == "CMZ"
+    assert main.second_part_from_model(model) == "MCD"
@@ -0,0 +1,30 @@
+"""
+Generate datastreams of any length.
+"""
+import random
+import string
+from typing import Iterator
+
+SEED = 2022
+CHUNK_SIZE = 2**16
+# Too few letters to ever form a start-of-packet or start-of-message marker
+FILLER_LETTERS = "abc"
+MARKER_LENGTH = 14
+
+
+def generate_input(size: int, seed: int = SEED) -> Iterator[str]:
+    """
+    Yield a datastream of size characters in chunks.
+
+    Both markers are only found at the very end so the solvers must scan
+    the whole stream.
+    """
+    rng = random.Random(seed)
+    filler_length = max(size - MARKER_LENGTH, 0)
+    for start in range(0, filler_length, CHUNK_SIZE):
+        chunk_length = min(CHUNK_SIZE, filler_length - start)
+        yield "".join(rng.choices(FILLER_LETTERS, k=chunk_length))
+    marker_letters = [
+        letter for letter in string.ascii_lowercase if letter not in FILLER_LETTERS
+    ]
+    yield f"{''.join(rng.sample(marker_letters, k=MARKER_LENGTH))}\n"
@@ -11,7 +11,7 @@ from functools import reduce, total_ordering
 from itertools import accumulate, compress
 from pathlib import Path
 from textwrap import dedent
-from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 
 def find_start_of(text: str, distinct_count: int) -> int:
@@ -49,6 +49,34 @@ def second_part(text: str) -> int:
     return find_start_of(text=text, distinct_count=14)
 
 
+def solve_chunks(chunks: Iterable[str]) -> Tuple[int, int]:
+    """
+    Solve both parts in a single pass over chunks of the datastream.
+
+    Instead of a window of letters, the position where each letter was last
+    seen is kept. The letters since the latest repeat are all distinct, so a
+    marker is found once there are at least as many of them as needed.
+    """
+    first_part_count, second_part_count = 4, 14
+    answers: Dict[int, int] = {}
+    last_seen: Dict[str, int] = {}
+    distinct_start = 0
+    idx = 0
+    for chunk in chunks:
+        for letter in chunk:
+            distinct_start = max(distinct_start, last_seen.get(letter, -1) + 1)
+            last_seen[letter] = idx
+            idx += 1
+            distinct_length = idx - distinct_start
+            for distinct_count in (first_part_count, second_part_count):
+                if distinct_count not in answers and distinct_length >= distinct_count:
+                    answers[distinct_count] = idx
+            if len(answers) == 2:
+                return answers[first_part_count], answers[second_part_count]
+
+    raise ValueError("Expected to find both a unique 4 and 14 letter part.")
+
+
 if __name__ == "__main__":
     file_path_arg = sys.argv[1]
     if len(file_path_arg) == 0:
@@ -0,0 +1,48 @@
+"""
+Generate terminal transcripts of file trees of any size.
+"""
+import random
+from typing import Iterator, List
+
+SEED = 2022
+# The solvers recurse once per directory level
+MAX_DEPTH = 100
+MAX_FILES_PER_DIRECTORY = 4
+
+
+def generate_input(
+    size: int, seed: int = SEED, max_depth: int = MAX_DEPTH
+) -> Iterator[str]:
+    """
+    Yield a transcript that walks a tree of size directories line by line.
+
+    New directories are attached to one of the most recently created ones
+    which makes for deep trees, as long as max_depth is not reached.
+    """
+    rng = random.Random(seed)
+    children: List[List[int]] = [[] for _ in range(size)]
+    depths = [0]
+    for directory in range(1, size):
+        parent = rng.randint(max(0, directory - 4), directory - 1)
+        if depths[parent] >= max_depth:
+            parent = 0
+        children[parent].append(directory)
+        depths.append(depths[parent] + 1)
+
+    yield "$ cd /\n"
+    # Walk the tree depth first without recursion
+    stack = [0]
+    while stack:
+        directory = stack.pop()
+        if directory < 0:
+            yield "$ cd ..\n"
+            continue
+        if directory != 0:
+            yield f"$ cd d{directory}\n"
+        yield "$ ls\n"
+        for child in children[directory]:
+            yield f"dir d{child}\n"
+        for file_idx in range(rng.randint(0, MAX_FILES_PER_DIRECTORY)):
+            yield f"{rng.randint(1000, 300000)} f{file_idx}.txt\n"
+        for child in reversed(children[directory]):
+            stack.extend((-1, child))
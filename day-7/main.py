@@ -161,16 +161,29 @@ def parse_file_tree(text: str) -> Directory:
     return file_tree
 
 
-def first_part(text: str):
+def parse_model(text: str) -> Directory:
     """
-    Solve first part.
+    Parse text into the file tree shared by both parts.
+    """
+    return parse_file_tree(text=text)
+
+
+def first_part_from_model(file_tree: Directory) -> int:
+    """
+    Solve first part from a parsed file tree.
     """
-    file_tree = parse_file_tree(text=text)
     return sum(
         search_lower_than_value(value=100000, file_tree=file_tree, collection=[])
     )
 
 
+def first_part(text: str):
+    """
+    Solve first part.
+    """
+    return first_part_from_model(parse_model(text=text))
+
+
 def find_smallest_possible(value: int, file_tree: Directory, collection: List[int]):
     file_tree_size = file_tree.file_size()
     if file_tree_size >= value:
@@ -186,11 +199,10 @@ def find_smallest_possible(value: int, file_tree: Directory, collection: List[in
     return collection
 
 
-def second_part(text: str) -> int:
+def second_part_from_model(file_tree: Directory) -> int:
     """
-    Solve second part.
+    Solve second part from a parsed file tree.
     """
-    file_tree = parse_file_tree(text=text)
     total_disk_space = 70000000
     needed_disk_space = 30000000
     used_space = file_tree.file_size()
@@ -204,17 +216,25 @@ def second_part(text: str) -> int:
     return min(collection)
 
 
+def second_part(text: str) -> int:
+    """
+    Solve second part.
+    """
+    return second_part_from_model(parse_model(text=text))
+
+
 if __name__ == "__main__":
     file_path_arg = sys.argv[1]
     if len(file_path_arg) == 0:
         raise ValueError("Expected a filepath to be passed as argument.")
     file_path = Path(file_path_arg)
     text = file_path.read_text()
+    model = parse_model(text=text)
 
-    first_part_answer = first_part(text=text)
+    first_part_answer = first_part_from_model(model)
 
     print(f"Answer to first part: {first_part_answer}")
 
-    second_part_answer = second_part(text=text)
+    second_part_answer = second_part_from_model(model)
 
     print(f"Answer to second part: {second_part_answer}")
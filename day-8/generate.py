@@ -0,0 +1,16 @@
+"""
+Generate tree height grids of any size.
+"""
+import random
+from typing import Iterator
+
+SEED = 2022
+
+
+def generate_input(size: int, seed: int = SEED) -> Iterator[str]:
+    """
+    Yield a size by size grid of tree heights row by row.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield f"{''.join(rng.choices('0123456789', k=size))}\n"
@@ -47,12 +47,17 @@ def find_visible_for_row_from_tree(row: List[int], tree_height: int) -> List[int
     return row_visible
 
 
-def first_part(text: str) -> int:
+def parse_model(text: str) -> List[List[int]]:
     """
-    Solve first part.
+    Parse text into the tree height matrix shared by both parts.
     """
+    return parse_text(text=text)
+
 
-    matrix = parse_text(text=text)
+def first_part_from_model(matrix: List[List[int]]) -> int:
+    """
+    Solve first part from a parsed tree height matrix.
+    """
     rows_visible: List[List[int]] = []
     for row in matrix:
         row_visible = find_visible_for_row(row)
@@ -88,6 +93,13 @@ def first_part(text: str) -> int:
     return how_many_trees
 
 
+def first_part(text: str) -> int:
+    """
+    Solve first part.
+    """
+    return first_part_from_model(parse_model(text=text))
+
+
 def scores_for_arrays(arrays) -> List[List[int]]:
     rows_scores: List[List[int]] = []
     for row in arrays:
@@ -127,11 +139,10 @@ def scores_for_arrays(arrays) -> List[List[int]]:
     return rows_scores
 
 
-def second_part(text: str) -> int:
+def second_part_from_model(matrix: List[List[int]]) -> int:
     """
-    Solve second part.
+    Solve second part from a parsed tree height matrix.
     """
-    matrix = parse_text(text=text)
     rows_scores = scores_for_arrays(arrays=matrix)
     columns = [[row[idx] for row in matrix] for idx in range(len(matrix))]
     columns_scores = scores_for_arrays(arrays=columns)
@@ -157,17 +168,25 @@ def second_part(text: str) -> int:
     #     columns_visible.append(column_visible_all)
 
 
+def second_part(text: str) -> int:
+    """
+    Solve second part.
+    """
+    return second_part_from_model(parse_model(text=text))
+
+
 if __name__ == "__main__":
     file_path_arg = sys.argv[1]
     if len(file_path_arg) == 0:
         raise ValueError("Expected a filepath to be passed as argument.")
     file_path = Path(file_path_arg)
     text = file_path.read_text()
+    model = parse_model(text=text)
 
-    first_part_answer = first_part(text=text)
+    first_part_answer = first_part_from_model(model)
 
     print(f"Answer to first part: {first_part_answer}")
 
-    second_part_answer = second_part(text=text)
+    second_part_answer = second_part_from_model(model)
 
     print(f"Answer to second part: {second_part_answer}")
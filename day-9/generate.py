@@ -0,0 +1,17 @@
+"""
+Generate rope motion series of any size.
+"""
+import random
+from typing import Iterator
+
+SEED = 2022
+MAX_MOVE_COUNT = 20
+
+
+def generate_input(size: int, seed: int = SEED) -> Iterator[str]:
+    """
+    Yield size motions line by line.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield f"{rng.choice('RUDL')} {rng.randint(1, MAX_MOVE_COUNT)}\n"
@@ -227,12 +227,17 @@ class LongRope:
         return LongRope(segments=moved_segments)
 
 
-def first_part(text: str) -> int:
+def parse_model(text: str) -> List[Command]:
     """
-    Solve first part.
+    Parse text into the motions shared by both parts.
     """
-    motions = [parse_line(line) for line in text.splitlines()]
+    return [parse_line(line) for line in text.splitlines()]
+
 
+def first_part_from_model(motions: List[Command]) -> int:
+    """
+    Solve first part from parsed motions.
+    """
     start_point = Point(0, 0)
     rope = Rope(head=start_point, tail=start_point)
     tail_positions = {start_point}
@@ -248,12 +253,17 @@ def first_part(text: str) -> int:
     return len(tail_positions)
 
 
-def second_part(text: str) -> int:
+def first_part(text: str) -> int:
     """
-    Solve second part.
+    Solve first part.
     """
-    motions = [parse_line(line) for line in text.splitlines()]
+    return first_part_from_model(parse_model(text=text))
 
+
+def second_part_from_model(motions: List[Command]) -> int:
+    """
+    Solve second part from parsed motions.
+    """
     start_point = Point(0, 0)
     long_rope_segments = [Rope(head=start_point, tail=start_point) for _ in range(9)]
     long_rope = LongRope(segments=long_rope_segments)
@@ -276,17 +286,25 @@ def second_part(text: str) -> int:
     return len(tail_positions)
 
 
+def second_part(text: str) -> int:
+    """
+    Solve second part.
+    """
+    return second_part_from_model(parse_model(text=text))
+
+
 if __name__ == "__main__":
     file_path_arg = sys.argv[1]
     if len(file_path_arg) == 0:
         raise ValueError("Expected a filepath to be passed as argument.")
     file_path = Path(file_path_arg)
     text = file_path.read_text()
+    model = parse_model(text=text)
 
-    first_part_answer = first_part(text=text)
+    first_part_answer = first_part_from_model(model)
 
     print(f"Answer to first part: {first_part_answer}")
 
-    second_part_answer = second_part(text=text)
+    second_part_answer = second_part_from_model(model)
 
     print(f"Answer to second part: {second_part_answer}")